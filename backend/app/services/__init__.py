@@ -2,8 +2,9 @@
 
 from .audio_extractor import audio_extractor, AudioExtractor
 from .transcriber import transcriber, Transcriber
-from .context_builder import context_builder, ContextBuilder
-from .translator import translator, Translator
+from .transcript_table import TranscriptTable
+from .context_builder import context_builder, get_context_builder, ContextBuilder
+from .translator import translator, Translator, TranslatedSegment
 from .srt_generator import srt_generator, SRTGenerator
 
 __all__ = [
@@ -11,10 +12,13 @@ __all__ = [
     "AudioExtractor",
     "transcriber",
     "Transcriber",
+    "TranscriptTable",
     "context_builder",
+    "get_context_builder",
     "ContextBuilder",
     "translator",
     "Translator",
+    "TranslatedSegment",
     "srt_generator",
     "SRTGenerator",
 ]
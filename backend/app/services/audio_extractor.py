@@ -1,9 +1,24 @@
+import asyncio
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from app.utils import settings, file_handler
 
+# Resolve the binaries once at import so each invocation skips the OS
+# PATH walk (and keeps working if PATH changes under the server)
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Default FFmpeg thread cap; overridable so callers running many
+# concurrent extractions (batch jobs, parallel test workers) can divide
+# the cores instead of each process claiming all of them
+_DEFAULT_FFMPEG_THREADS = os.environ.get("AITOD_FFMPEG_THREADS")
+
 
 class AudioExtractor:
     """Service for extracting audio from video files using FFmpeg."""
@@ -12,7 +27,8 @@ class AudioExtractor:
     async def extract_audio(
         video_path: Path,
         output_path: Optional[Path] = None,
-        file_id: Optional[str] = None
+        file_id: Optional[str] = None,
+        ffmpeg_threads: Optional[int] = None
     ) -> Path:
         """Extract audio from video file and save as WAV.
 
@@ -20,6 +36,11 @@ class AudioExtractor:
             video_path: Path to the input video file
             output_path: Optional path for output audio file
             file_id: Optional file ID, required if output_path is not provided
+            ffmpeg_threads: Optional cap on FFmpeg's decode threads.
+                Defaults to the AITOD_FFMPEG_THREADS env var, else
+                FFmpeg's own default. Set this when running several
+                extractions concurrently so they don't oversubscribe
+                the CPU.
 
         Returns:
             Path to the extracted audio file
@@ -43,6 +64,8 @@ class AudioExtractor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # FFmpeg command to extract audio
+        # -nostdin/-hide_banner/-loglevel error: trim startup work and
+        #   stderr noise on every spawn
         # -i: input file
         # -vn: disable video
         # -acodec pcm_s16le: use PCM 16-bit little-endian codec (high quality WAV)
@@ -50,38 +73,158 @@ class AudioExtractor:
         # -ac 1: convert to mono (reduces file size, good for speech)
         # -y: overwrite output file if exists
         command = [
-            "ffmpeg",
+            _FFMPEG,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
             "-i", str(video_path),
             "-vn",
             "-acodec", "pcm_s16le",
             "-ar", "16000",
             "-ac", "1",
             "-y",
-            str(output_path)
         ]
 
+        threads = ffmpeg_threads or _DEFAULT_FFMPEG_THREADS
+        if threads:
+            command += ["-threads", str(threads)]
+
+        command.append(str(output_path))
+
         try:
-            # Run FFmpeg command
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True
+            # Run FFmpeg without blocking the event loop so concurrent
+            # extractions can overlap. Only stderr is captured; stdout is
+            # silent when writing to a file, so don't allocate a pipe for it
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
             )
+            _, stderr = await process.communicate()
+
+            if process.returncode != 0:
+                error_message = f"FFmpeg failed to extract audio: {stderr.decode(errors='replace')}"
+                raise RuntimeError(error_message)
 
             # Verify output file was created
             if not file_handler.file_exists(output_path):
                 raise RuntimeError("FFmpeg completed but output file was not created")
 
+            # Record the written file for later cleanup
+            if file_id is not None:
+                await file_handler.register_file(file_id, output_path)
+
             return output_path
 
-        except subprocess.CalledProcessError as e:
-            error_message = f"FFmpeg failed to extract audio: {e.stderr}"
-            raise RuntimeError(error_message)
+        except RuntimeError:
+            raise
+
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error during audio extraction: {str(e)}")
+
+    @staticmethod
+    async def extract_audio_to_array(video_path: Path) -> np.ndarray:
+        """Extract audio as raw samples piped straight from FFmpeg.
+
+        Skips the WAV-on-disk round trip entirely for in-process
+        consumers: FFmpeg writes 16 kHz mono s16le samples to stdout and
+        they land directly in a NumPy array.
+
+        Args:
+            video_path: Path to the input video file
+
+        Returns:
+            int16 array of mono audio samples at 16 kHz
+
+        Raises:
+            FileNotFoundError: If video file doesn't exist
+            RuntimeError: If FFmpeg extraction fails
+        """
+        if not file_handler.file_exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        command = [
+            _FFMPEG,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", str(video_path),
+            "-vn",
+            "-f", "s16le",
+            "-ar", "16000",
+            "-ac", "1",
+            "-"
+        ]
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate()
+
+            if process.returncode != 0:
+                error_message = f"FFmpeg failed to extract audio: {stderr.decode(errors='replace')}"
+                raise RuntimeError(error_message)
+
+            return np.frombuffer(stdout, dtype=np.int16)
+
+        except RuntimeError:
+            raise
 
         except Exception as e:
             raise RuntimeError(f"Unexpected error during audio extraction: {str(e)}")
 
+    @staticmethod
+    async def extract_audio_batch(
+        items: list[tuple[Path, Optional[Path], Optional[str]]],
+        concurrency: int = 4,
+        ffmpeg_threads: Optional[int] = None
+    ) -> list[Path]:
+        """Extract audio from multiple videos concurrently.
+
+        Runs one FFmpeg process per video with a bounded semaphore so
+        multi-video batches overlap decoder work across cores instead of
+        running sequentially.
+
+        Args:
+            items: List of (video_path, output_path, file_id) tuples, using
+                the same semantics as extract_audio
+            concurrency: Maximum number of FFmpeg processes to run at once
+            ffmpeg_threads: Optional per-process decode thread cap.
+                Defaults to splitting the available cores across the
+                concurrent processes.
+
+        Returns:
+            List of paths to the extracted audio files, in input order
+
+        Raises:
+            FileNotFoundError: If any video file doesn't exist
+            RuntimeError: If any FFmpeg extraction fails
+            ValueError: If an item provides neither output_path nor file_id
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Divide cores across the concurrent processes so N FFmpegs
+        # don't each claim the whole machine and thrash on context
+        # switches
+        if ffmpeg_threads is None and not _DEFAULT_FFMPEG_THREADS:
+            ffmpeg_threads = max(1, (os.cpu_count() or concurrency) // concurrency)
+
+        async def _extract_one(
+            video_path: Path,
+            output_path: Optional[Path],
+            file_id: Optional[str]
+        ) -> Path:
+            async with semaphore:
+                return await AudioExtractor.extract_audio(
+                    video_path, output_path, file_id,
+                    ffmpeg_threads=ffmpeg_threads
+                )
+
+        return list(await asyncio.gather(*[_extract_one(*item) for item in items]))
+
     @staticmethod
     async def extract_audio_with_timestamps(
         video_path: Path,
@@ -105,14 +248,63 @@ class AudioExtractor:
         # Extract audio
         audio_path = await AudioExtractor.extract_audio(video_path, output_path, file_id)
 
-        # Get audio duration using FFprobe
+        # Get duration (WAV header fast path, FFprobe fallback)
         duration = await AudioExtractor.get_audio_duration(audio_path)
 
         return audio_path, duration
 
+    @staticmethod
+    def _duration_from_wav_header(audio_path: Path) -> Optional[float]:
+        """Compute audio duration from a WAV file's RIFF header.
+
+        Walks the RIFF chunks to find the fmt byte rate and the data chunk
+        size, so the duration is data_size / byte_rate without spawning
+        FFprobe.
+
+        Args:
+            audio_path: Path to the WAV file
+
+        Returns:
+            Duration in seconds, or None if the header can't be parsed
+        """
+        try:
+            with open(audio_path, 'rb') as f:
+                riff = f.read(12)
+                if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+                    return None
+
+                byte_rate = None
+                # Walk chunks until both fmt and data have been seen
+                while True:
+                    chunk_header = f.read(8)
+                    if len(chunk_header) < 8:
+                        return None
+
+                    chunk_id = chunk_header[:4]
+                    chunk_size = int.from_bytes(chunk_header[4:8], 'little')
+
+                    if chunk_id == b'fmt ':
+                        fmt_data = f.read(chunk_size)
+                        if len(fmt_data) < 16:
+                            return None
+                        byte_rate = int.from_bytes(fmt_data[8:12], 'little')
+                    elif chunk_id == b'data':
+                        if not byte_rate:
+                            return None
+                        return chunk_size / byte_rate
+                    else:
+                        # Skip unrelated chunks (e.g. LIST metadata)
+                        f.seek(chunk_size, 1)
+
+        except OSError:
+            return None
+
     @staticmethod
     async def get_audio_duration(audio_path: Path) -> float:
-        """Get duration of audio file in seconds using FFprobe.
+        """Get duration of audio file in seconds.
+
+        WAV files are answered from the RIFF header without spawning a
+        process; everything else falls through to FFprobe.
 
         Args:
             audio_path: Path to the audio file
@@ -127,9 +319,13 @@ class AudioExtractor:
         if not file_handler.file_exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        duration = AudioExtractor._duration_from_wav_header(audio_path)
+        if duration is not None:
+            return duration
+
         # FFprobe command to get duration
         command = [
-            "ffprobe",
+            _FFPROBE,
             "-v", "error",
             "-show_entries", "format=duration",
             "-of", "default=noprint_wrappers=1:nokey=1",
@@ -137,42 +333,60 @@ class AudioExtractor:
         ]
 
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True
+            # Run FFprobe without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            stdout, stderr = await process.communicate()
 
-            duration = float(result.stdout.strip())
-            return duration
+            if process.returncode != 0:
+                error_message = f"FFprobe failed to get audio duration: {stderr.decode(errors='replace')}"
+                raise RuntimeError(error_message)
 
-        except subprocess.CalledProcessError as e:
-            error_message = f"FFprobe failed to get audio duration: {e.stderr}"
-            raise RuntimeError(error_message)
+            try:
+                duration = float(stdout.decode().strip())
+            except ValueError:
+                raise RuntimeError(f"Failed to parse duration from FFprobe output: {stdout.decode(errors='replace')}")
+
+            return duration
 
-        except ValueError:
-            raise RuntimeError(f"Failed to parse duration from FFprobe output: {result.stdout}")
+        except RuntimeError:
+            raise
 
         except Exception as e:
             raise RuntimeError(f"Unexpected error getting audio duration: {str(e)}")
 
+    # Cached result of check_ffmpeg_installed; FFmpeg availability doesn't
+    # change while the server runs, so one probe is enough
+    _ffmpeg_available: Optional[bool] = None
+
     @staticmethod
     def check_ffmpeg_installed() -> bool:
         """Check if FFmpeg is installed and accessible.
 
+        The result is cached after the first call, so repeated health
+        checks don't each pay for an `ffmpeg -version` process spawn.
+
         Returns:
             True if FFmpeg is available, False otherwise
         """
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        if AudioExtractor._ffmpeg_available is None:
+            try:
+                # Discard output directly instead of capturing buffers
+                # that are never read
+                subprocess.run(
+                    [_FFMPEG, "-version"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
+                AudioExtractor._ffmpeg_available = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                AudioExtractor._ffmpeg_available = False
+
+        return AudioExtractor._ffmpeg_available
 
 
 # Create singleton instance
@@ -1,11 +1,91 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Optional
 
+import numpy as np
+
 from app.utils import llm_client, settings
 
 
 class ContextBuilder:
     """Service for building context summaries from transcript segments."""
 
+    # LRU response cache for LLM-generated context summaries, keyed on
+    # (transcript hash, source language, provider). Repeat uploads of the
+    # same content skip the API call entirely.
+    _context_cache: "OrderedDict[tuple, str]" = OrderedDict()
+    _CONTEXT_CACHE_MAX_SIZE = 512
+
+    # Similarity cache for near-duplicate transcripts (lightly re-edited
+    # re-uploads). Each entry is a hashed bag-of-words embedding with its
+    # cached context; lookups match on cosine similarity above threshold.
+    _sim_embeddings: List[np.ndarray] = []
+    _sim_entries: List[tuple] = []  # (source_language, provider, context)
+    _SIM_EMBED_DIM = 256
+    _SIM_THRESHOLD = 0.92
+    _SIM_CACHE_MAX_SIZE = 1024
+
+    # Word budget for the transcript excerpt sent to the LLM. Words are a
+    # close-enough proxy for tokens (~0.75 words per token in English)
+    # without pulling in a tokenizer dependency.
+    _CONTEXT_SAMPLE_MAX_WORDS = 400
+
+    @staticmethod
+    def _sample_transcript(full_text: str) -> str:
+        """Sample a representative excerpt of the transcript for the LLM.
+
+        Short transcripts are returned whole. Long ones are sampled as
+        head + middle + tail windows at word boundaries, so the summary
+        sees how the content opens, develops, and ends instead of only
+        the first N characters (which also avoids mid-word truncation).
+
+        Args:
+            full_text: Complete transcript text
+
+        Returns:
+            Excerpt bounded by the word budget
+        """
+        words = full_text.split()
+        budget = ContextBuilder._CONTEXT_SAMPLE_MAX_WORDS
+
+        if len(words) <= budget:
+            return " ".join(words)
+
+        window = budget // 3
+        middle = len(words) // 2
+        head = words[:window]
+        body = words[middle - window // 2:middle + window // 2]
+        tail = words[-window:]
+
+        return " ".join(head) + " ... " + " ".join(body) + " ... " + " ".join(tail)
+
+    @staticmethod
+    def _embed_text(text: str) -> np.ndarray:
+        """Compute a cheap hashed bag-of-words embedding for text.
+
+        Tokens are hashed into a fixed number of buckets and the resulting
+        count vector is L2-normalized, so cosine similarity approximates
+        word-overlap between transcripts without any model dependency.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            L2-normalized float64 vector of length _SIM_EMBED_DIM
+        """
+        vector = np.zeros(ContextBuilder._SIM_EMBED_DIM, dtype=np.float64)
+        for token in text.lower().split():
+            bucket = int.from_bytes(
+                hashlib.blake2b(token.encode(), digest_size=4).digest(), 'little'
+            ) % ContextBuilder._SIM_EMBED_DIM
+            vector[bucket] += 1.0
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
     @staticmethod
     async def build_context(
         segments: List[Dict[str, any]],
@@ -33,11 +113,12 @@ class ContextBuilder:
             raise ValueError("Cannot build context from empty segments")
 
         # Extract full text from segments
-        full_text = " ".join(segment['text'] for segment in segments)
+        full_text = " ".join([segment['text'] for segment in segments])
 
-        # If text is too short, return a simple context
-        if len(full_text.strip()) < 10:
-            return "Short video content without specific context."
+        # If text is too short to be worth an LLM round-trip, the cheap
+        # local summary carries as much signal as the model would
+        if len(full_text.strip()) < 200:
+            return ContextBuilder.build_simple_context(segments, source_language)
 
         # Build context using LLM
         context = await ContextBuilder._generate_context_with_llm(
@@ -66,6 +147,34 @@ class ContextBuilder:
         """
         provider = provider or settings.DEFAULT_LLM_PROVIDER
 
+        # Sample a representative, token-bounded excerpt of the transcript
+        excerpt = ContextBuilder._sample_transcript(full_text)
+
+        # Check the response cache before paying for another API call
+        cache_key = (
+            hashlib.sha256(excerpt.encode()).hexdigest(),
+            source_language,
+            provider
+        )
+        cached = ContextBuilder._context_cache.get(cache_key)
+        if cached is not None:
+            # Refresh LRU position
+            ContextBuilder._context_cache.move_to_end(cache_key)
+            return cached
+
+        # Exact match missed; look for a near-duplicate transcript
+        embedding = ContextBuilder._embed_text(excerpt)
+        if ContextBuilder._sim_embeddings:
+            sims = np.stack(ContextBuilder._sim_embeddings) @ embedding
+            best = int(np.argmax(sims))
+            entry_language, entry_provider, entry_context = ContextBuilder._sim_entries[best]
+            if (
+                sims[best] > ContextBuilder._SIM_THRESHOLD
+                and entry_language == source_language
+                and entry_provider == provider
+            ):
+                return entry_context
+
         # Create prompt for context generation
         prompt = f"""Analyze the following transcript in {source_language} language and provide a brief context summary (2-3 sentences maximum).
 
@@ -77,7 +186,7 @@ Include:
 Keep it concise and focused on information that would help a translator maintain accuracy and consistency.
 
 Transcript:
-"{full_text[:2000]}"
+"{excerpt}"
 
 Context Summary:"""
 
@@ -101,7 +210,22 @@ Context Summary:"""
             else:
                 raise ValueError(f"Unknown provider: {provider}")
 
-            return context.strip()
+            context = context.strip()
+
+            # Cache successful responses only, evicting the oldest entry
+            # once the cache is full
+            ContextBuilder._context_cache[cache_key] = context
+            if len(ContextBuilder._context_cache) > ContextBuilder._CONTEXT_CACHE_MAX_SIZE:
+                ContextBuilder._context_cache.popitem(last=False)
+
+            # Record the embedding for similarity lookups (FIFO eviction)
+            ContextBuilder._sim_embeddings.append(embedding)
+            ContextBuilder._sim_entries.append((source_language, provider, context))
+            if len(ContextBuilder._sim_embeddings) > ContextBuilder._SIM_CACHE_MAX_SIZE:
+                ContextBuilder._sim_embeddings.pop(0)
+                ContextBuilder._sim_entries.pop(0)
+
+            return context
 
         except Exception as e:
             # Fallback to basic context if LLM fails
@@ -127,10 +251,14 @@ Context Summary:"""
         if not segments:
             return "Empty transcript."
 
-        # Extract full text
-        full_text = " ".join(segment['text'] for segment in segments)
-        word_count = len(full_text.split())
-        duration = segments[-1]['end'] - segments[0]['start'] if segments else 0
+        # Count words in one pass without materializing the joined
+        # transcript: space-count + 1 per non-empty segment is a close
+        # (and explicitly approximate) stand-in for split()
+        word_count = sum(
+            segment['text'].count(" ") + 1
+            for segment in segments if segment['text']
+        )
+        duration = segments[-1]['end'] - segments[0]['start']
 
         # Build basic context
         context = (
@@ -177,5 +305,16 @@ Context Summary:"""
         return context
 
 
-# Create singleton instance
-context_builder = ContextBuilder()
+@lru_cache(maxsize=1)
+def get_context_builder() -> ContextBuilder:
+    """Return the process-wide ContextBuilder, built on first use.
+
+    Callers that may never touch the LLM path (health checks, simple
+    context tests) can defer grabbing the service until they actually
+    need it instead of paying for it at import.
+    """
+    return ContextBuilder()
+
+
+# Create singleton instance (shares the cached accessor's instance)
+context_builder = get_context_builder()
@@ -1,10 +1,57 @@
-from typing import List, Dict, Optional
+import asyncio
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Optional, TextIO, Union
 from pathlib import Path
-import srt
-from datetime import timedelta
+
+import aiofiles
+import numpy as np
+import pandas as pd
 
 from app.utils import file_handler
 
+# Compiled once at import: matches "HH:MM:SS,mmm --> HH:MM:SS,mmm"
+# (also tolerating '.' as the millisecond separator)
+_TIMESTAMP_RE = re.compile(
+    r'(\d+):(\d+):(\d+)[,.](\d+)\s*-->\s*(\d+):(\d+):(\d+)[,.](\d+)'
+)
+
+# Runs of blank lines inside a cue body; collapsed before composing
+# since a blank line would terminate the cue early
+_BLANK_RUN_RE = re.compile(r'\n{2,}')
+
+# Zero-padded digit tables built once at import; indexing a tuple is
+# cheaper than running %02d/%03d format dispatch twice per subtitle
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+_THREE_DIGITS = tuple(f"{i:03d}" for i in range(1000))
+
+
+@dataclass(slots=True)
+class _TimeSpec:
+    """Subtitle time held as plain seconds with a timedelta-style accessor."""
+
+    _seconds: float
+
+    def total_seconds(self) -> float:
+        return self._seconds
+
+
+@dataclass(slots=True)
+class Subtitle:
+    """Slot-backed subtitle record.
+
+    Four slots instead of a dict-backed object graph, with the classic
+    subtitle attribute surface (index/start/end/content, times exposed
+    via total_seconds()).
+    """
+
+    index: int
+    start: _TimeSpec
+    end: _TimeSpec
+    content: str
+
 
 class SRTGenerator:
     """Service for generating SRT subtitle files from translated segments."""
@@ -19,12 +66,85 @@ class SRTGenerator:
         Returns:
             Formatted timestamp string (e.g., "00:00:05,500")
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
+        # One float->int conversion up front, then pure integer divmods
+        # and digit-table lookups; no per-field format dispatch
+        total_ms = int(seconds * 1000 + 0.5)
+        hours, total_ms = divmod(total_ms, 3_600_000)
+        minutes, total_ms = divmod(total_ms, 60_000)
+        secs, milliseconds = divmod(total_ms, 1000)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+        hh = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+        return f"{hh}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]},{_THREE_DIGITS[milliseconds]}"
+
+    @staticmethod
+    def _format_timestamps(seconds: np.ndarray) -> List[str]:
+        """Format an array of times in seconds to SRT timestamps.
+
+        Vectorized version of format_timestamp: the hour/minute/second/
+        millisecond splits run as NumPy array operations instead of
+        per-subtitle Python arithmetic.
+
+        Args:
+            seconds: 1-D array of times in seconds
+
+        Returns:
+            List of formatted timestamp strings
+        """
+        # Round to the millisecond grid before casting — same +0.5 as the
+        # scalar formatter; a bare astype would truncate and drop a
+        # millisecond on values like 1.001
+        total_ms = np.floor(
+            np.asarray(seconds, dtype=np.float64) * 1000 + 0.5
+        ).astype(np.int64)
+        hours = total_ms // 3_600_000
+        minutes = (total_ms // 60_000) % 60
+        secs = (total_ms // 1000) % 60
+        milliseconds = total_ms % 1000
+
+        return [
+            f"{_TWO_DIGITS[h] if h < 100 else h}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]},{_THREE_DIGITS[ms]}"
+            for h, m, s, ms in zip(
+                hours.tolist(), minutes.tolist(), secs.tolist(), milliseconds.tolist()
+            )
+        ]
+
+    @staticmethod
+    def _compose_fast(
+        starts: List[str],
+        ends: List[str],
+        texts: List[str],
+        first_index: int = 1
+    ) -> str:
+        """Compose SRT content from pre-formatted timestamps and texts.
+
+        Joins the subtitle blocks with a single str.join instead of
+        building per-cue objects, avoiding two N-sized allocations and a
+        redundant reformat pass.
+
+        Args:
+            starts: Formatted start timestamps
+            ends: Formatted end timestamps
+            texts: Subtitle texts
+            first_index: Index of the first cue (parallel chunk workers
+                pass their offset so numbering stays global)
+
+        Returns:
+            SRT formatted string
+        """
+        # Blank lines inside a cue would terminate it early, so normalize
+        # line endings and collapse newline runs of any length (a single
+        # '\n\n' replace would leave a blank line behind for 3+ runs)
+        cleaned = [
+            _BLANK_RUN_RE.sub('\n', text.replace('\r\n', '\n')).strip()
+            for text in texts
+        ]
+
+        return "".join(
+            f"{i}\n{start} --> {end}\n{text}\n\n"
+            for i, (start, end, text) in enumerate(
+                zip(starts, ends, cleaned), start=first_index
+            )
+        )
 
     @staticmethod
     def create_subtitle(
@@ -32,8 +152,8 @@ class SRTGenerator:
         start_time: float,
         end_time: float,
         text: str
-    ) -> srt.Subtitle:
-        """Create an SRT subtitle object.
+    ) -> "Subtitle":
+        """Create a subtitle object.
 
         Args:
             index: Subtitle number (1-indexed)
@@ -42,12 +162,12 @@ class SRTGenerator:
             text: Subtitle text
 
         Returns:
-            srt.Subtitle object
+            Subtitle object
         """
-        return srt.Subtitle(
+        return Subtitle(
             index=index,
-            start=timedelta(seconds=start_time),
-            end=timedelta(seconds=end_time),
+            start=_TimeSpec(start_time),
+            end=_TimeSpec(end_time),
             content=text
         )
 
@@ -74,27 +194,95 @@ class SRTGenerator:
         # Determine which text field to use
         text_field = 'translated_text' if use_translated else 'text'
 
-        # Validate segments have required fields
+        # Validate and extract in a single pass over segments instead of a
+        # separate pre-validation loop
+        start_seconds = np.empty(len(segments), dtype=np.float64)
+        end_seconds = np.empty(len(segments), dtype=np.float64)
+        texts = []
         for i, segment in enumerate(segments):
-            if 'start' not in segment or 'end' not in segment:
+            try:
+                start_seconds[i] = segment['start']
+                end_seconds[i] = segment['end']
+            except KeyError:
                 raise ValueError(f"Segment {i} missing 'start' or 'end' field")
-            if text_field not in segment:
+            try:
+                texts.append(segment[text_field])
+            except KeyError:
                 raise ValueError(f"Segment {i} missing '{text_field}' field")
 
-        # Create subtitle objects
-        subtitles = []
-        for i, segment in enumerate(segments, start=1):
-            subtitle = SRTGenerator.create_subtitle(
-                index=i,
-                start_time=segment['start'],
-                end_time=segment['end'],
-                text=segment[text_field]
+        # Format all timestamps in one vectorized pass
+        starts = SRTGenerator._format_timestamps(start_seconds)
+        ends = SRTGenerator._format_timestamps(end_seconds)
+
+        # Compose SRT text directly, bypassing per-subtitle timedelta
+        # construction and any reformat pass
+        return SRTGenerator._compose_fast(starts, ends, texts)
+
+    @staticmethod
+    async def generate_srt_parallel(
+        segments: List[Dict[str, any]],
+        use_translated: bool = True,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000
+    ) -> str:
+        """Generate SRT content for very large transcripts in parallel.
+
+        Splits the work into chunks composed in a process pool, handing
+        each worker three flat arrays (starts, ends, texts) instead of a
+        list of dicts so pickling moves a fraction of the bytes. Below
+        one chunk it delegates to generate_srt_from_segments — pool
+        startup would cost more than it saves.
+
+        Args:
+            segments: List of segments with timestamps and text
+            use_translated: If True, use 'translated_text' field, else use 'text'
+            workers: Process count; defaults to the executor's own choice
+            chunk_size: Segments composed per worker task
+
+        Returns:
+            SRT formatted string
+
+        Raises:
+            ValueError: If segments is empty or missing required fields
+        """
+        if len(segments) <= chunk_size:
+            return await asyncio.to_thread(
+                SRTGenerator.generate_srt_from_segments, segments, use_translated
             )
-            subtitles.append(subtitle)
 
-        # Generate SRT content
-        srt_content = srt.compose(subtitles)
-        return srt_content
+        text_field = 'translated_text' if use_translated else 'text'
+
+        # Structure-of-arrays extraction: one pass, three flat buffers
+        count = len(segments)
+        starts = np.empty(count, dtype=np.float64)
+        ends = np.empty(count, dtype=np.float64)
+        texts = []
+        for i, segment in enumerate(segments):
+            try:
+                starts[i] = segment['start']
+                ends[i] = segment['end']
+            except KeyError:
+                raise ValueError(f"Segment {i} missing 'start' or 'end' field")
+            try:
+                texts.append(segment[text_field])
+            except KeyError:
+                raise ValueError(f"Segment {i} missing '{text_field}' field")
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool,
+                    _compose_chunk,
+                    starts[offset:offset + chunk_size],
+                    ends[offset:offset + chunk_size],
+                    texts[offset:offset + chunk_size],
+                    offset + 1
+                )
+                for offset in range(0, count, chunk_size)
+            ])
+
+        return "".join(parts)
 
     @staticmethod
     async def save_srt(
@@ -116,25 +304,101 @@ class SRTGenerator:
             ValueError: If segments is empty or invalid
             Exception: If saving fails
         """
-        # Generate SRT content
-        srt_content = SRTGenerator.generate_srt_from_segments(segments, use_translated)
+        # Generate SRT content on a worker thread; composing 10k+ segments
+        # is CPU-bound and would otherwise stall the event loop
+        srt_content = await asyncio.to_thread(
+            SRTGenerator.generate_srt_from_segments, segments, use_translated
+        )
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(srt_content)
+            # Encode once and write the whole file in a single unbuffered
+            # binary write off the event loop; no text-wrapper or
+            # BufferedWriter setup for a write-once payload
+            await asyncio.to_thread(output_path.write_bytes, srt_content.encode('utf-8'))
 
             return output_path
 
         except Exception as e:
             raise Exception(f"Failed to save SRT file: {str(e)}")
 
+    @staticmethod
+    async def save_bilingual_srt(
+        segments: List[Dict[str, any]],
+        original_path: Path,
+        translated_path: Path
+    ) -> tuple[Path, Path]:
+        """Save original and translated SRT files in one fused pass.
+
+        Extracts and formats the shared start/end timestamps once, then
+        composes both documents from them, instead of two independent
+        save_srt calls each re-walking the segments and re-formatting
+        identical timestamps.
+
+        Args:
+            segments: List of segments with 'text' and 'translated_text'
+            original_path: Path for the original-language SRT file
+            translated_path: Path for the translated-language SRT file
+
+        Returns:
+            Tuple of (original_path, translated_path)
+
+        Raises:
+            ValueError: If segments is empty or missing required fields
+            Exception: If saving fails
+        """
+        if not segments:
+            raise ValueError("Cannot generate SRT from empty segments")
+
+        def _compose_both() -> tuple[str, str]:
+            start_seconds = np.empty(len(segments), dtype=np.float64)
+            end_seconds = np.empty(len(segments), dtype=np.float64)
+            originals = []
+            translations = []
+            for i, segment in enumerate(segments):
+                try:
+                    start_seconds[i] = segment['start']
+                    end_seconds[i] = segment['end']
+                except KeyError:
+                    raise ValueError(f"Segment {i} missing 'start' or 'end' field")
+                try:
+                    originals.append(segment['text'])
+                    translations.append(segment['translated_text'])
+                except KeyError as e:
+                    raise ValueError(f"Segment {i} missing {e} field")
+
+            starts = SRTGenerator._format_timestamps(start_seconds)
+            ends = SRTGenerator._format_timestamps(end_seconds)
+            return (
+                SRTGenerator._compose_fast(starts, ends, originals),
+                SRTGenerator._compose_fast(starts, ends, translations)
+            )
+
+        original_content, translated_content = await asyncio.to_thread(_compose_both)
+
+        original_path.parent.mkdir(parents=True, exist_ok=True)
+        translated_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            async def _write(path: Path, content: str) -> None:
+                async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+                    await f.write(content)
+
+            await asyncio.gather(
+                _write(original_path, original_content),
+                _write(translated_path, translated_content)
+            )
+
+            return original_path, translated_path
+
+        except Exception as e:
+            raise Exception(f"Failed to save SRT file: {str(e)}")
+
     @staticmethod
     async def generate_srt_from_csv(
-        csv_path: Path,
+        csv_path: Union[Path, TextIO],
         output_path: Optional[Path] = None,
         file_id: Optional[str] = None,
         use_translated: bool = True
@@ -142,7 +406,9 @@ class SRTGenerator:
         """Generate SRT file from CSV transcript/translation file.
 
         Args:
-            csv_path: Path to the CSV file with segments
+            csv_path: Path to the CSV file with segments, or an open text
+                buffer of translated-CSV content (spares the disk
+                round-trip when the CSV was just produced in memory)
             output_path: Optional path for output SRT file
             file_id: Optional file ID, required if output_path is not provided
             use_translated: If True, expect translated segments, else use original text
@@ -155,38 +421,67 @@ class SRTGenerator:
             FileNotFoundError: If CSV file doesn't exist
             Exception: If generation fails
         """
+        # Determine output path (validate before loading the CSV)
+        if output_path is None:
+            if file_id is None:
+                raise ValueError("Either output_path or file_id must be provided")
+            output_path = file_handler.get_file_path(file_id, "output", "srt")
+
         # Import here to avoid circular dependency
         if use_translated:
-            # Load translated segments from CSV
-            import csv
-            if not file_handler.file_exists(csv_path):
-                raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
-            segments = []
-            with open(csv_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    segments.append({
-                        'start': float(row['start_time']),
-                        'end': float(row['end_time']),
-                        'text': row.get('original_text', ''),
-                        'translated_text': row['translated_text']
-                    })
+            # Fused path: parse with pandas (C-level; reads Paths and
+            # text buffers alike and raises FileNotFoundError itself),
+            # then compose straight from the columns without ever
+            # materializing a list-of-dicts in between
+            df = pd.read_csv(
+                csv_path,
+                dtype={
+                    'start_time': float,
+                    'end_time': float,
+                    'original_text': str,
+                    'translated_text': str
+                },
+                # Empty text cells stay "" instead of becoming NaN
+                keep_default_na=False
+            )
+            if df.empty:
+                raise ValueError("Cannot generate SRT from empty segments")
+            if 'translated_text' not in df.columns:
+                raise ValueError("CSV is missing the 'translated_text' column")
+
+            def _compose() -> str:
+                starts = SRTGenerator._format_timestamps(
+                    df['start_time'].to_numpy(dtype=np.float64)
+                )
+                ends = SRTGenerator._format_timestamps(
+                    df['end_time'].to_numpy(dtype=np.float64)
+                )
+                return SRTGenerator._compose_fast(
+                    starts, ends, df['translated_text'].tolist()
+                )
+
+            srt_content = await asyncio.to_thread(_compose)
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                await asyncio.to_thread(
+                    output_path.write_bytes, srt_content.encode('utf-8')
+                )
+            except Exception as e:
+                raise Exception(f"Failed to save SRT file: {str(e)}")
+
         else:
-            # Load original transcript
+            # Load original transcript and go through the regular save path
             from .transcriber import transcriber
             segments = await transcriber.load_transcript_from_csv(csv_path)
 
-        # Determine output path
-        if output_path is None:
-            if file_id is None:
-                raise ValueError("Either output_path or file_id must be provided")
-            output_path = file_handler.get_file_path(file_id, "output", "srt")
+            await SRTGenerator.save_srt(segments, output_path, use_translated)
 
-        # Save SRT
-        srt_path = await SRTGenerator.save_srt(segments, output_path, use_translated)
+        # Record the written file for later cleanup
+        if file_id is not None:
+            await file_handler.register_file(file_id, output_path)
 
-        return srt_path
+        return output_path
 
     @staticmethod
     def parse_srt(srt_content: str) -> List[Dict[str, any]]:
@@ -202,20 +497,296 @@ class SRTGenerator:
             Exception: If parsing fails
         """
         try:
-            subtitles = srt.parse(srt_content)
+            starts, ends, texts = SRTGenerator.parse_srt_soa(srt_content)
+            return [
+                {'start': start, 'end': end, 'text': text}
+                for start, end, text in zip(starts, ends, texts)
+            ]
+
+        except Exception as e:
+            raise Exception(f"Failed to parse SRT content: {str(e)}")
+
+    @staticmethod
+    def parse_srt_soa(
+        srt_content: str
+    ) -> "tuple[array, array, List[str]]":
+        """Parse SRT content into structure-of-arrays form.
+
+        Start and end times come back as contiguous array('d') buffers
+        alongside a plain text list, so bulk passes over a large
+        document touch packed doubles instead of one boxed float pair
+        per cue; parse_srt wraps this when callers want dicts.
+
+        Args:
+            srt_content: SRT formatted string
+
+        Returns:
+            Tuple of (starts, ends, texts) with times in seconds
+
+        Raises:
+            ValueError: If no recognizable cues can be parsed
+        """
+        soa = SRTGenerator._parse_srt_fast(srt_content)
+        if soa is not None:
+            return soa
+
+        # Fall back to the tolerant regex parser for anything the fast
+        # path doesn't recognize (odd timestamp widths, '.' millisecond
+        # separators)
+        segments = SRTGenerator._parse_srt_tolerant(srt_content)
+        return (
+            array('d', (segment['start'] for segment in segments)),
+            array('d', (segment['end'] for segment in segments)),
+            [segment['text'] for segment in segments]
+        )
+
+    @staticmethod
+    def _parse_srt_tolerant(srt_content: str) -> List[Dict[str, any]]:
+        """Parse loosely formatted SRT content with the timestamp regex.
+
+        Fallback for content the strict state machine rejects: accepts
+        variable-width timestamp fields and '.' as the millisecond
+        separator, at the cost of one regex search per cue.
+
+        Args:
+            srt_content: SRT formatted string
+
+        Returns:
+            List of dictionaries with 'start', 'end', 'text' keys
+
+        Raises:
+            ValueError: If a block contains no recognizable timecode
+        """
+        content = srt_content.replace('\r\n', '\n').strip()
+        if not content:
+            return []
+
+        segments = []
+        for block in re.split(r'\n\s*\n', content):
+            lines = block.split('\n')
+
+            # The timestamp normally sits on the line after the index;
+            # tolerate a missing index line
+            match = _TIMESTAMP_RE.search(lines[0])
+            text_start = 1
+            if match is None and len(lines) > 1:
+                match = _TIMESTAMP_RE.search(lines[1])
+                text_start = 2
+            if match is None:
+                raise ValueError(f"No timecode found in SRT block: {block[:80]!r}")
+
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = (int(g) for g in match.groups())
+            segments.append({
+                'start': h1 * 3600 + m1 * 60 + s1 + ms1 / 1000.0,
+                'end': h2 * 3600 + m2 * 60 + s2 + ms2 / 1000.0,
+                'text': '\n'.join(lines[text_start:])
+            })
+
+        return segments
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> float:
+        """Parse a fixed-width "HH:MM:SS,mmm" timestamp to seconds.
+
+        Positional int slices, no regex; raises ValueError on anything
+        that isn't the standard 12-character form (callers fall back to
+        the tolerant regex parser).
+
+        Args:
+            value: Timestamp string in HH:MM:SS,mmm form ('.' also
+                accepted as the millisecond separator)
+
+        Returns:
+            Time in seconds
+        """
+        if len(value) != 12 or value[2] != ':' or value[5] != ':' or value[8] not in ',.':
+            raise ValueError(f"Malformed SRT timestamp: {value!r}")
+        return (
+            int(value[0:2]) * 3600
+            + int(value[3:5]) * 60
+            + int(value[6:8])
+            + int(value[9:12]) / 1000.0
+        )
+
+    @staticmethod
+    def _parse_srt_fast(
+        srt_content: str
+    ) -> "Optional[tuple[array, array, List[str]]]":
+        """Parse well-formed SRT content on the strict fast path.
+
+        Single pass over splitlines with a small header/timecode/text
+        state machine: timecodes are split with str.partition and parsed
+        by positional int slices, so there is no regex dispatch or
+        capture-group allocation per cue. Times accumulate straight into
+        packed double arrays.
+
+        Args:
+            srt_content: SRT formatted string
+
+        Returns:
+            (starts, ends, texts) tuple, or None if the content doesn't
+            look like standard SRT (caller falls back to the tolerant parser)
+        """
+        starts = array('d')
+        ends = array('d')
+        texts: List[str] = []
+        start = end = None
+        saw_index = False
+        text_lines: List[str] = []
+
+        try:
+            for line in srt_content.splitlines():
+                if start is None:
+                    # Waiting for a cue header: optional index line, then
+                    # the timecode line
+                    if not line.strip():
+                        continue
+                    if ' --> ' in line:
+                        raw_start, _, raw_end = line.partition(' --> ')
+                        start = SRTGenerator._parse_timestamp(raw_start.strip())
+                        end = SRTGenerator._parse_timestamp(raw_end.strip())
+                        saw_index = False
+                    elif saw_index:
+                        # Two non-timecode lines in a row where a
+                        # timecode was expected
+                        return None
+                    else:
+                        saw_index = True
+                elif line.strip():
+                    text_lines.append(line)
+                else:
+                    # Blank line terminates the cue
+                    starts.append(start)
+                    ends.append(end)
+                    texts.append('\n'.join(text_lines))
+                    start = end = None
+                    text_lines = []
+
+        except ValueError:
+            return None
+
+        if start is not None:
+            starts.append(start)
+            ends.append(end)
+            texts.append('\n'.join(text_lines))
+        elif saw_index:
+            # Trailing garbage that never became a cue
+            return None
+
+        return starts, ends, texts
+
+    @staticmethod
+    def peek_srt(srt_path: Path) -> tuple[int, float, float]:
+        """Read SRT metadata without parsing every cue.
+
+        Finds the first timestamp in the head of the file and the last
+        timestamp by reading only the tail, so metadata queries (duration
+        checks, progress displays) don't pay for a full parse. Cue count
+        comes from a raw byte scan for the arrow separator.
+
+        Args:
+            srt_path: Path to the SRT file
 
-            segments = []
-            for subtitle in subtitles:
-                segments.append({
-                    'start': subtitle.start.total_seconds(),
-                    'end': subtitle.end.total_seconds(),
-                    'text': subtitle.content
-                })
+        Returns:
+            Tuple of (cue_count, first_start_seconds, last_end_seconds)
 
-            return segments
+        Raises:
+            FileNotFoundError: If SRT file doesn't exist
+            Exception: If no timestamps can be found
+        """
+        try:
+            # The open raises FileNotFoundError itself; no preflight stat
+            with open(srt_path, 'rb') as f:
+                head = f.read(4096).decode('utf-8', errors='replace')
+
+                # Count cues with a cheap byte scan instead of parsing.
+                # Carry the last two bytes of each chunk into the next so
+                # an arrow straddling a chunk boundary still counts
+                f.seek(0)
+                cue_count = 0
+                carry = b''
+                while True:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    cue_count += (carry + chunk).count(b'-->')
+                    carry = chunk[-2:]
+
+                # Last timestamp lives in the file's tail
+                f.seek(max(0, f.tell() - 4096))
+                tail = f.read().decode('utf-8', errors='replace')
+
+            first_match = _TIMESTAMP_RE.search(head)
+            last_match = None
+            for last_match in _TIMESTAMP_RE.finditer(tail):
+                pass
+            if first_match is None or last_match is None:
+                raise ValueError("No timestamps found in SRT file")
+
+            h, m, s, ms = (int(g) for g in first_match.groups()[:4])
+            first_start = h * 3600 + m * 60 + s + ms / 1000.0
+
+            h, m, s, ms = (int(g) for g in last_match.groups()[4:])
+            last_end = h * 3600 + m * 60 + s + ms / 1000.0
+
+            return cue_count, first_start, last_end
+
+        except FileNotFoundError:
+            raise
 
         except Exception as e:
-            raise Exception(f"Failed to parse SRT content: {str(e)}")
+            raise Exception(f"Failed to peek SRT file: {str(e)}")
+
+    @staticmethod
+    async def iter_srt(srt_path: Path) -> "AsyncIterator[Dict[str, any]]":
+        """Stream segments from an SRT file one cue at a time.
+
+        Drives the same state machine as _parse_srt_fast over the file
+        line by line, so peak memory stays at one cue instead of the raw
+        content plus the fully parsed list. Malformed cues raise
+        ValueError; callers that need tolerance should fall back to
+        load-then-parse_srt.
+
+        Args:
+            srt_path: Path to the SRT file
+
+        Yields:
+            Dictionaries with 'start', 'end', 'text' keys
+
+        Raises:
+            FileNotFoundError: If SRT file doesn't exist
+            ValueError: If a cue doesn't match the standard SRT form
+        """
+        async with aiofiles.open(srt_path, 'r', encoding='utf-8') as f:
+            start = end = None
+            saw_index = False
+            text_lines: List[str] = []
+
+            async for raw in f:
+                line = raw.rstrip('\r\n')
+                if start is None:
+                    if not line.strip():
+                        continue
+                    if ' --> ' in line:
+                        raw_start, _, raw_end = line.partition(' --> ')
+                        start = SRTGenerator._parse_timestamp(raw_start.strip())
+                        end = SRTGenerator._parse_timestamp(raw_end.strip())
+                        saw_index = False
+                    elif saw_index:
+                        raise ValueError(f"Malformed SRT cue header: {line!r}")
+                    else:
+                        saw_index = True
+                elif line.strip():
+                    text_lines.append(line)
+                else:
+                    yield {'start': start, 'end': end, 'text': '\n'.join(text_lines)}
+                    start = end = None
+                    text_lines = []
+
+            if start is not None:
+                yield {'start': start, 'end': end, 'text': '\n'.join(text_lines)}
+            elif saw_index:
+                raise ValueError("Trailing content without a timecode in SRT file")
 
     @staticmethod
     async def load_srt(srt_path: Path) -> List[Dict[str, any]]:
@@ -231,19 +802,43 @@ class SRTGenerator:
             FileNotFoundError: If SRT file doesn't exist
             Exception: If loading or parsing fails
         """
-        if not file_handler.file_exists(srt_path):
-            raise FileNotFoundError(f"SRT file not found: {srt_path}")
-
         try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                srt_content = f.read()
-
-            segments = SRTGenerator.parse_srt(srt_content)
-            return segments
+            # Stream the cues instead of holding raw content + parsed
+            # list at once; no preflight exists() — the open itself
+            # raises FileNotFoundError, saving a stat per load
+            return [segment async for segment in SRTGenerator.iter_srt(srt_path)]
+
+        except FileNotFoundError:
+            raise
+
+        except ValueError:
+            # Non-standard content: re-read whole and let the tolerant
+            # regex path in parse_srt have a go
+            try:
+                async with aiofiles.open(srt_path, 'r', encoding='utf-8') as f:
+                    srt_content = await f.read()
+                return await asyncio.to_thread(SRTGenerator.parse_srt, srt_content)
+            except Exception as e:
+                raise Exception(f"Failed to load SRT file: {str(e)}")
 
         except Exception as e:
             raise Exception(f"Failed to load SRT file: {str(e)}")
 
 
+def _compose_chunk(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    texts: List[str],
+    first_index: int
+) -> str:
+    """Compose one chunk of SRT content (process-pool worker)."""
+    return SRTGenerator._compose_fast(
+        SRTGenerator._format_timestamps(starts),
+        SRTGenerator._format_timestamps(ends),
+        texts,
+        first_index
+    )
+
+
 # Create singleton instance
 srt_generator = SRTGenerator()
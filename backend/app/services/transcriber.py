@@ -1,5 +1,10 @@
+import asyncio
 import csv
+import io
+from operator import itemgetter
 from pathlib import Path
+
+import pandas as pd
 from typing import List, Dict, Optional
 
 from app.utils import settings, file_handler, llm_client
@@ -37,7 +42,7 @@ class Transcriber:
         if language not in settings.SUPPORTED_LANGUAGES:
             raise ValueError(
                 f"Language '{language}' is not supported. "
-                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES)}"
+                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES_DISPLAY)}"
             )
 
         # Use llm_client to transcribe
@@ -74,6 +79,12 @@ class Transcriber:
             FileNotFoundError: If audio file doesn't exist
             Exception: If transcription or saving fails
         """
+        # Determine output path (validate before the expensive transcription step)
+        if output_csv_path is None:
+            if file_id is None:
+                raise ValueError("Either output_csv_path or file_id must be provided")
+            output_csv_path = file_handler.get_file_path(file_id, "transcript", "csv")
+
         # Transcribe audio
         segments = await Transcriber.transcribe_audio(
             audio_path=audio_path,
@@ -81,15 +92,13 @@ class Transcriber:
             provider=provider
         )
 
-        # Determine output path
-        if output_csv_path is None:
-            if file_id is None:
-                raise ValueError("Either output_csv_path or file_id must be provided")
-            output_csv_path = file_handler.get_file_path(file_id, "transcript", "csv")
-
         # Save to CSV
         csv_path = await Transcriber.save_transcript_to_csv(segments, output_csv_path)
 
+        # Record the written file for later cleanup
+        if file_id is not None:
+            await file_handler.register_file(file_id, csv_path)
+
         return segments, csv_path
 
     @staticmethod
@@ -117,21 +126,25 @@ class Transcriber:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Write to CSV
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['start_time', 'end_time', 'text']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                # Write header
-                writer.writeheader()
-
-                # Write segments
-                for segment in segments:
-                    writer.writerow({
-                        'start_time': segment['start'],
-                        'end_time': segment['end'],
-                        'text': segment['text']
-                    })
+            # Build the CSV content in memory, then write it with one
+            # non-blocking call so the event loop stays responsive
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+
+            # Write header and all rows in bulk; plain tuples avoid the
+            # per-row dict translation DictWriter does
+            writer.writerow(['start_time', 'end_time', 'text'])
+            writer.writerows(
+                (segment['start'], segment['end'], segment['text'])
+                for segment in segments
+            )
+
+            # One whole-file binary write on a worker thread: a single
+            # thread hop instead of the open/write/close hops an async
+            # file wrapper pays
+            await asyncio.to_thread(
+                output_path.write_bytes, buffer.getvalue().encode('utf-8')
+            )
 
             return output_path
 
@@ -152,22 +165,24 @@ class Transcriber:
             FileNotFoundError: If CSV file doesn't exist
             Exception: If loading fails
         """
-        if not file_handler.file_exists(csv_path):
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
         try:
-            segments = []
-            with open(csv_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
+            # Parse with pandas so float conversion happens in C instead of
+            # per-row Python, which matters for long transcripts. pandas
+            # raises FileNotFoundError itself, so there's no preflight
+            # exists() stat
+            # keep_default_na=False so an empty text cell stays "" instead
+            # of becoming NaN and breaking string operations downstream
+            df = pd.read_csv(
+                csv_path,
+                dtype={'start_time': float, 'end_time': float, 'text': str},
+                keep_default_na=False
+            )
+            df = df.rename(columns={'start_time': 'start', 'end_time': 'end'})
 
-                for row in reader:
-                    segments.append({
-                        'start': float(row['start_time']),
-                        'end': float(row['end_time']),
-                        'text': row['text']
-                    })
+            return df.to_dict('records')
 
-            return segments
+        except FileNotFoundError:
+            raise
 
         except Exception as e:
             raise Exception(f"Failed to load transcript from CSV: {str(e)}")
@@ -182,7 +197,9 @@ class Transcriber:
         Returns:
             Full transcript text as a single string
         """
-        return " ".join(segment['text'] for segment in segments)
+        # map + itemgetter keeps the per-segment field access in C and
+        # feeds join without an intermediate list
+        return " ".join(map(itemgetter('text'), segments))
 
 
 # Create singleton instance
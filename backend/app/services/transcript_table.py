@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class TranscriptTable:
+    """Columnar representation of a transcript.
+
+    Stores timestamps as NumPy arrays and texts as a plain list instead
+    of one dict per segment, which cuts per-segment memory overhead
+    dramatically on long transcripts and lets timestamp math and CSV
+    round-trips run vectorized.
+
+    Existing dict-based call sites can migrate gradually through
+    from_dicts/to_dicts.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+    texts: List[str]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_dicts(cls, segments: List[Dict[str, any]]) -> "TranscriptTable":
+        """Build a table from the List[Dict] segment format.
+
+        Args:
+            segments: List of dictionaries with 'start', 'end', 'text' keys
+
+        Returns:
+            TranscriptTable with one column per field
+        """
+        return cls(
+            starts=np.fromiter(
+                (segment['start'] for segment in segments),
+                dtype=np.float64,
+                count=len(segments)
+            ),
+            ends=np.fromiter(
+                (segment['end'] for segment in segments),
+                dtype=np.float64,
+                count=len(segments)
+            ),
+            texts=[segment['text'] for segment in segments]
+        )
+
+    def to_dicts(self) -> List[Dict[str, any]]:
+        """Convert back to the List[Dict] segment format.
+
+        Returns:
+            List of dictionaries with 'start', 'end', 'text' keys
+        """
+        return [
+            {'start': start, 'end': end, 'text': text}
+            for start, end, text in zip(self.starts.tolist(), self.ends.tolist(), self.texts)
+        ]
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> "TranscriptTable":
+        """Load a table from a transcript CSV file.
+
+        Args:
+            csv_path: Path to the CSV file with start_time/end_time/text columns
+
+        Returns:
+            TranscriptTable with the file's segments
+        """
+        # keep_default_na=False so an empty text cell stays "" instead of
+        # becoming NaN
+        df = pd.read_csv(
+            csv_path,
+            dtype={'start_time': float, 'end_time': float, 'text': str},
+            keep_default_na=False
+        )
+        return cls(
+            starts=df['start_time'].to_numpy(),
+            ends=df['end_time'].to_numpy(),
+            texts=df['text'].tolist()
+        )
+
+    def to_csv(self, output_path: Path) -> Path:
+        """Save the table to a transcript CSV file.
+
+        Args:
+            output_path: Path where the CSV file will be saved
+
+        Returns:
+            Path to the saved CSV file
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({
+            'start_time': self.starts,
+            'end_time': self.ends,
+            'text': self.texts
+        }).to_csv(output_path, index=False)
+        return output_path
+
+    def full_text(self) -> str:
+        """Concatenate all segment texts into one string.
+
+        Returns:
+            Full transcript text separated by spaces
+        """
+        return " ".join(self.texts)
@@ -1,12 +1,72 @@
-from typing import List, Dict, Optional
+import asyncio
+import csv
+import hashlib
+import io
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, NamedTuple, Optional, TextIO, Union
 from pathlib import Path
 
+import aiofiles
+
 from app.utils import settings, llm_client, file_handler
 
 
+# Rare character used to mark original segment boundaries inside a
+# merged chunk so the translation can be split back apart
+_MERGE_SENTINEL = "␟"
+
+
+class TranslatedSegment(NamedTuple):
+    """A translated transcript segment backed by a tuple.
+
+    Tuples carry no per-row hash table, so large transcripts use far
+    less memory than lists of dicts. String indexing and .get() are
+    provided so existing consumers that treat segments as mappings
+    (CSV writers, SRT generation) keep working unchanged.
+    """
+
+    start: float
+    end: float
+    text: str
+    translated_text: Optional[str] = None
+    error: Optional[str] = None
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        """Mapping-style lookup with a default, mirroring dict.get."""
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert to a plain dict for callers that need one."""
+        return {
+            'start': self.start,
+            'end': self.end,
+            'text': self.text,
+            'translated_text': self.translated_text,
+            **({'error': self.error} if self.error is not None else {})
+        }
+
+
 class Translator:
     """Service for translating transcript segments with context awareness."""
 
+    # LRU cache of finished translations keyed by
+    # (source, target, provider, context, text) hash. Subtitles repeat
+    # short phrases constantly, so hits skip the network entirely.
+    _translation_cache: "OrderedDict[str, str]" = OrderedDict()
+    _TRANSLATION_CACHE_MAX_SIZE = 4096
+
+    # In-flight calls by cache key so concurrent requests for the same
+    # text coalesce onto one API round-trip
+    _inflight: Dict[str, asyncio.Future] = {}
+
     @staticmethod
     async def translate_segment(
         text: str,
@@ -35,25 +95,61 @@ class Translator:
         if source_language not in settings.SUPPORTED_LANGUAGES:
             raise ValueError(
                 f"Source language '{source_language}' is not supported. "
-                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES)}"
+                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES_DISPLAY)}"
             )
 
         if target_language not in settings.SUPPORTED_LANGUAGES:
             raise ValueError(
                 f"Target language '{target_language}' is not supported. "
-                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES)}"
+                f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES_DISPLAY)}"
             )
 
-        # Use llm_client to translate
-        translated_text = await llm_client.translate_with_context(
-            text=text,
-            source_language=source_language,
-            target_language=target_language,
-            context=context,
-            provider=provider
-        )
+        # Check the translation cache; context is part of the key since it
+        # steers the translation
+        resolved_provider = provider or settings.DEFAULT_LLM_PROVIDER
+        cache_key = hashlib.blake2b(
+            f"{source_language}|{target_language}|{resolved_provider}|{context}|{text}".encode(),
+            digest_size=16
+        ).hexdigest()
+
+        cached = Translator._translation_cache.get(cache_key)
+        if cached is not None:
+            Translator._translation_cache.move_to_end(cache_key)
+            return cached
+
+        # Coalesce onto an identical in-flight call if one exists
+        inflight = Translator._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        Translator._inflight[cache_key] = future
+
+        try:
+            # Use llm_client to translate
+            translated_text = await llm_client.translate_with_context(
+                text=text,
+                source_language=source_language,
+                target_language=target_language,
+                context=context,
+                provider=provider
+            )
+
+            Translator._translation_cache[cache_key] = translated_text
+            if len(Translator._translation_cache) > Translator._TRANSLATION_CACHE_MAX_SIZE:
+                Translator._translation_cache.popitem(last=False)
 
-        return translated_text
+            future.set_result(translated_text)
+            return translated_text
+
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved so unawaited futures don't warn
+            future.exception()
+            raise
+
+        finally:
+            Translator._inflight.pop(cache_key, None)
 
     @staticmethod
     async def translate_segments(
@@ -61,50 +157,219 @@ class Translator:
         source_language: str,
         target_language: str,
         context: str = "",
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, any]]:
         """Translate all segments in a transcript with context awareness.
 
+        Segments are translated concurrently under a bounded semaphore:
+        the work is network-bound, so overlapping the API round-trips cuts
+        total latency close to linearly up to the concurrency cap.
+
         Args:
             segments: List of transcript segments with 'start', 'end', 'text'
             source_language: Source language code (ISO 639-1)
             target_language: Target language code (ISO 639-1)
             context: Context about the full content for better translation
             provider: LLM provider to use ('openai' or 'gemini'). If None, uses default.
+            concurrency: Maximum in-flight API calls. Defaults to
+                settings.MAX_CONCURRENT_JOBS.
 
         Returns:
-            List of translated segments with same structure plus 'translated_text' field
+            List of translated segments with same structure plus 'translated_text'
+            field. Segments whose translation ultimately failed carry
+            'translated_text': None and an 'error' message instead of
+            aborting the whole transcript.
 
         Raises:
             ValueError: If segments is empty or languages are not supported
-            Exception: If translation fails
         """
         if not segments:
             raise ValueError("Cannot translate empty segments")
 
-        translated_segments = []
+        semaphore = asyncio.Semaphore(concurrency or settings.MAX_CONCURRENT_JOBS)
+
+        # Transcripts repeat filler lines and speaker labels constantly;
+        # translate each distinct text once and fan the result back out
+        # to every position it occupies
+        unique_indices: "Dict[str, List[int]]" = {}
+        for i, segment in enumerate(segments):
+            unique_indices.setdefault(segment['text'], []).append(i)
+
+        async def _translate_text(text: str):
+            try:
+                async with semaphore:
+                    return await Translator.translate_segment(
+                        text=text,
+                        source_language=source_language,
+                        target_language=target_language,
+                        context=context,
+                        provider=provider
+                    )
+            except ValueError:
+                # Bad languages/provider fail the whole call; nothing
+                # would succeed anyway
+                raise
+            except Exception as e:
+                # One failed text shouldn't discard the rest of the
+                # transcript's successful work
+                return e
+
+        # TaskGroup rather than a bare gather: if the fast-fail ValueError
+        # fires, the remaining in-flight calls are cancelled instead of
+        # burning quota behind an already-doomed transcript
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_translate_text(text)) for text in unique_indices]
+        except* ValueError as eg:
+            raise eg.exceptions[0] from None
+
+        results = [task.result() for task in tasks]
+
+        translated_segments: List[TranslatedSegment] = [None] * len(segments)
+        for indices, result in zip(unique_indices.values(), results):
+            for i in indices:
+                segment = segments[i]
+                if isinstance(result, Exception):
+                    translated_segments[i] = TranslatedSegment(
+                        segment['start'], segment['end'], segment['text'],
+                        None, str(result)
+                    )
+                else:
+                    translated_segments[i] = TranslatedSegment(
+                        segment['start'], segment['end'], segment['text'], result
+                    )
+
+        return translated_segments
+
+    @staticmethod
+    def _merge_segments(
+        segments: List[Dict[str, any]],
+        max_chars: int = 400,
+        max_gap: float = 1.0
+    ) -> List[List[Dict[str, any]]]:
+        """Group adjacent short segments into translation-sized chunks.
+
+        ASR output is often one or two words per segment; translating
+        each alone makes the prompt dwarf the content. Segments are
+        merged while the combined text stays under max_chars and the
+        silence between consecutive segments is at most max_gap seconds.
+
+        Args:
+            segments: List of transcript segments with 'start', 'end', 'text'
+            max_chars: Character budget for one merged chunk
+            max_gap: Maximum seconds of silence to merge across
+
+        Returns:
+            List of chunks, each a list of the original segments in order
+        """
+        chunks: List[List[Dict[str, any]]] = []
+        current: List[Dict[str, any]] = []
+        current_chars = 0
 
         for segment in segments:
-            # Translate the text
-            translated_text = await Translator.translate_segment(
-                text=segment['text'],
-                source_language=source_language,
-                target_language=target_language,
-                context=context,
-                provider=provider
+            text_len = len(segment['text'])
+            fits = (
+                current
+                and current_chars + text_len <= max_chars
+                and segment['start'] - current[-1]['end'] <= max_gap
             )
+            if fits:
+                current.append(segment)
+                current_chars += text_len
+            else:
+                if current:
+                    chunks.append(current)
+                current = [segment]
+                current_chars = text_len
 
-            # Create new segment with translation
-            translated_segment = {
-                'start': segment['start'],
-                'end': segment['end'],
-                'text': segment['text'],
-                'translated_text': translated_text
-            }
+        if current:
+            chunks.append(current)
 
-            translated_segments.append(translated_segment)
+        return chunks
 
-        return translated_segments
+    @staticmethod
+    async def translate_segments_merged(
+        segments: List[Dict[str, any]],
+        source_language: str,
+        target_language: str,
+        context: str = "",
+        provider: Optional[str] = None,
+        max_chars: int = 400,
+        max_gap: float = 1.0
+    ) -> List[TranslatedSegment]:
+        """Translate segments after merging tiny neighbours into one call.
+
+        Adjacent short segments are concatenated with a sentinel marker,
+        translated as a single text, and split back along the markers so
+        the original timing boundaries survive. This cuts the number of
+        API calls by roughly the average chunk size. Chunks whose
+        translation loses or gains markers fall back to per-segment
+        translation.
+
+        Args:
+            segments: List of transcript segments with 'start', 'end', 'text'
+            source_language: Source language code (ISO 639-1)
+            target_language: Target language code (ISO 639-1)
+            context: Context about the full content for better translation
+            provider: LLM provider to use ('openai' or 'gemini'). If None, uses default.
+            max_chars: Character budget for one merged chunk
+            max_gap: Maximum seconds of silence to merge across
+
+        Returns:
+            List of translated segments, one per input segment
+
+        Raises:
+            ValueError: If segments is empty or languages are not supported
+        """
+        if not segments:
+            raise ValueError("Cannot translate empty segments")
+
+        chunks = Translator._merge_segments(segments, max_chars, max_gap)
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+
+        async def _translate_chunk(chunk: List[Dict[str, any]]) -> List[TranslatedSegment]:
+            merged_text = f" {_MERGE_SENTINEL} ".join(s['text'] for s in chunk)
+            try:
+                async with semaphore:
+                    translated = await Translator.translate_segment(
+                        text=merged_text,
+                        source_language=source_language,
+                        target_language=target_language,
+                        context=context,
+                        provider=provider
+                    )
+            except ValueError:
+                raise
+            except Exception:
+                return await Translator.translate_segments(
+                    segments=chunk,
+                    source_language=source_language,
+                    target_language=target_language,
+                    context=context,
+                    provider=provider
+                )
+
+            parts = [part.strip() for part in translated.split(_MERGE_SENTINEL)]
+            if len(parts) != len(chunk):
+                # The model dropped or invented a boundary marker;
+                # retranslate this chunk segment by segment
+                return await Translator.translate_segments(
+                    segments=chunk,
+                    source_language=source_language,
+                    target_language=target_language,
+                    context=context,
+                    provider=provider
+                )
+
+            return [
+                TranslatedSegment(s['start'], s['end'], s['text'], part)
+                for s, part in zip(chunk, parts)
+            ]
+
+        results = await asyncio.gather(*[_translate_chunk(chunk) for chunk in chunks])
+
+        return [segment for chunk in results for segment in chunk]
 
     @staticmethod
     async def translate_segments_batch(
@@ -117,35 +382,131 @@ class Translator:
     ) -> List[Dict[str, any]]:
         """Translate segments in batches for better performance.
 
-        This method processes segments in batches to optimize API calls
-        while maintaining context awareness.
+        Packs batch_size segments into each LLM call, amortizing the
+        prompt prefix (system message, context) across the batch. Batches
+        run concurrently under the same cap as translate_segments. If a
+        batched response doesn't align with its inputs, that batch falls
+        back to per-segment translation.
 
         Args:
             segments: List of transcript segments
             source_language: Source language code (ISO 639-1)
             target_language: Target language code (ISO 639-1)
             context: Context about the full content
-            batch_size: Number of segments to process together (not used yet, reserved for future optimization)
+            batch_size: Number of segments to pack into one API call
             provider: LLM provider to use
 
         Returns:
             List of translated segments
 
-        Note:
-            Currently processes segments one by one. Batch processing can be
-            implemented in the future to optimize API calls.
+        Raises:
+            ValueError: If segments is empty or languages are not supported
+            Exception: If translation fails
         """
-        # For now, this is the same as translate_segments
-        # In the future, we could optimize by combining multiple segments
-        # into a single API call
-        return await Translator.translate_segments(
-            segments=segments,
+        if not segments:
+            raise ValueError("Cannot translate empty segments")
+
+        # Validate languages once up front (translate_segment does this
+        # per call on the fallback path)
+        for language in (source_language, target_language):
+            if language not in settings.SUPPORTED_LANGUAGES:
+                raise ValueError(
+                    f"Language '{language}' is not supported. "
+                    f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES_DISPLAY)}"
+                )
+
+        batches = [
+            segments[i:i + batch_size]
+            for i in range(0, len(segments), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+
+        async def _translate_batch(batch: List[Dict[str, any]]) -> List[Dict[str, any]]:
+            async with semaphore:
+                try:
+                    translations = await llm_client.translate_batch_with_context(
+                        texts=[segment['text'] for segment in batch],
+                        source_language=source_language,
+                        target_language=target_language,
+                        context=context,
+                        provider=provider
+                    )
+                except ValueError:
+                    # Misaligned batch response; retranslate one by one
+                    return await Translator.translate_segments(
+                        segments=batch,
+                        source_language=source_language,
+                        target_language=target_language,
+                        context=context,
+                        provider=provider
+                    )
+
+            return [
+                TranslatedSegment(
+                    segment['start'], segment['end'], segment['text'], translated_text
+                )
+                for segment, translated_text in zip(batch, translations)
+            ]
+
+        results = await asyncio.gather(*[_translate_batch(batch) for batch in batches])
+
+        return [segment for batch in results for segment in batch]
+
+    @staticmethod
+    async def translate_segments_batch_api(
+        segments: List[Dict[str, any]],
+        source_language: str,
+        target_language: str,
+        context: str = "",
+        timeout: float = 24 * 60 * 60
+    ) -> List[Dict[str, any]]:
+        """Translate segments through the OpenAI Batch API.
+
+        For large offline jobs with no interactive latency requirement:
+        the batch endpoint costs roughly half the synchronous price and
+        runs under separate, higher rate limits, at the cost of waiting
+        for the batch to complete (up to 24 hours).
+
+        Args:
+            segments: List of transcript segments
+            source_language: Source language code (ISO 639-1)
+            target_language: Target language code (ISO 639-1)
+            context: Context about the full content
+            timeout: Maximum seconds to wait for the batch to complete
+
+        Returns:
+            List of translated segments
+
+        Raises:
+            ValueError: If segments is empty or languages are not supported
+            TimeoutError: If the batch doesn't complete within timeout
+            Exception: If the batch job fails
+        """
+        if not segments:
+            raise ValueError("Cannot translate empty segments")
+
+        for language in (source_language, target_language):
+            if language not in settings.SUPPORTED_LANGUAGES:
+                raise ValueError(
+                    f"Language '{language}' is not supported. "
+                    f"Supported languages: {', '.join(settings.SUPPORTED_LANGUAGES_DISPLAY)}"
+                )
+
+        translations = await llm_client.translate_batch_api(
+            texts=[segment['text'] for segment in segments],
             source_language=source_language,
             target_language=target_language,
             context=context,
-            provider=provider
+            timeout=timeout
         )
 
+        return [
+            TranslatedSegment(
+                segment['start'], segment['end'], segment['text'], translated_text
+            )
+            for segment, translated_text in zip(segments, translations)
+        ]
+
     @staticmethod
     async def translate_from_csv(
         csv_path: Path,
@@ -187,19 +548,85 @@ class Translator:
 
         return translated_segments
 
+    @staticmethod
+    async def translate_csv_to_csv(
+        csv_path: Path,
+        output_path: Path,
+        source_language: str,
+        target_language: str,
+        context: str = "",
+        provider: Optional[str] = None
+    ) -> Path:
+        """Translate a CSV transcript straight into a translated CSV.
+
+        Pipelines translation with the write: segments are translated
+        concurrently (bounded by MAX_CONCURRENT_JOBS) and each row is
+        streamed to disk as soon as its translation is ready, in input
+        order. Peak memory is bounded by the in-flight window instead of
+        the whole translated transcript, and disk I/O overlaps the
+        remaining LLM round-trips.
+
+        Args:
+            csv_path: Path to the CSV transcript file
+            output_path: Path where the translated CSV will be saved
+            source_language: Source language code (ISO 639-1)
+            target_language: Target language code (ISO 639-1)
+            context: Context about the full content
+            provider: LLM provider to use
+
+        Returns:
+            Path to the saved CSV file
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            Exception: If translation or saving fails
+        """
+        # Import here to avoid circular dependency
+        from .transcriber import transcriber
+
+        segments = await transcriber.load_transcript_from_csv(csv_path)
+
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+
+        async def _translate_one(segment: Dict[str, any]) -> Dict[str, any]:
+            async with semaphore:
+                translated_text = await Translator.translate_segment(
+                    text=segment['text'],
+                    source_language=source_language,
+                    target_language=target_language,
+                    context=context,
+                    provider=provider
+                )
+            return {**segment, 'translated_text': translated_text}
+
+        async def _rows() -> "AsyncIterator[Dict[str, any]]":
+            # Launch everything up front; yield in input order so the
+            # output CSV preserves segment order while later rows keep
+            # translating in the background
+            tasks = [asyncio.create_task(_translate_one(s)) for s in segments]
+            try:
+                for task in tasks:
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return await Translator.save_translated_segments_stream(_rows(), output_path)
+
     @staticmethod
     async def save_translated_segments_to_csv(
         translated_segments: List[Dict[str, any]],
-        output_path: Path
-    ) -> Path:
-        """Save translated segments to CSV file.
+        output_path: Union[Path, TextIO]
+    ) -> Union[Path, TextIO]:
+        """Save translated segments to CSV file or text buffer.
 
         Args:
             translated_segments: List of segments with 'translated_text' field
-            output_path: Path where CSV file will be saved
+            output_path: Path where CSV file will be saved, or an open
+                text buffer (e.g. io.StringIO) to skip the disk entirely
 
         Returns:
-            Path to the saved CSV file
+            Path to the saved CSV file, or the buffer that was written
 
         Raises:
             ValueError: If translated_segments is empty
@@ -208,28 +635,94 @@ class Translator:
         if not translated_segments:
             raise ValueError("Cannot save empty translated segments")
 
+        # Ensure output directory exists (not needed for in-memory targets)
+        if not hasattr(output_path, "write"):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            content = Translator._rows_to_csv(translated_segments)
+
+            if hasattr(output_path, "write"):
+                output_path.write(content)
+            else:
+                async with aiofiles.open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                    await csvfile.write(content)
+
+            return output_path
+
+        except Exception as e:
+            raise Exception(f"Failed to save translated segments to CSV: {str(e)}")
+
+    @staticmethod
+    def _rows_to_csv(translated_segments: List[Dict[str, any]]) -> str:
+        """Serialize translated segments to CSV text.
+
+        Builds the whole file in memory with tuple rows (no per-row dict
+        translation) so callers can make a single write; tests can also
+        assert on the serialized form directly without a disk round-trip.
+
+        Args:
+            translated_segments: List of segments with 'translated_text' field
+
+        Returns:
+            Full CSV content including the header row
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['start_time', 'end_time', 'original_text', 'translated_text'])
+        writer.writerows(
+            (segment['start'], segment['end'], segment['text'], segment['translated_text'])
+            for segment in translated_segments
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    async def save_translated_segments_stream(
+        segments: "AsyncIterator[Dict[str, any]]",
+        output_path: Path
+    ) -> Path:
+        """Stream translated segments to a CSV file as they arrive.
+
+        Rows hit disk as each segment is yielded, so callers can pair
+        this with an as-completed translation pipeline and never hold the
+        whole translated transcript in memory.
+
+        Args:
+            segments: Async iterator of segments with 'translated_text' field
+            output_path: Path where CSV file will be saved
+
+        Returns:
+            Path to the saved CSV file
+
+        Raises:
+            Exception: If saving fails
+        """
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            import csv
-
-            # Write to CSV
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['start_time', 'end_time', 'original_text', 'translated_text']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                # Write header
-                writer.writeheader()
-
-                # Write segments
-                for segment in translated_segments:
-                    writer.writerow({
-                        'start_time': segment['start'],
-                        'end_time': segment['end'],
-                        'original_text': segment['text'],
-                        'translated_text': segment['translated_text']
-                    })
+            # csv handles quoting into the buffer; each row is flushed to
+            # the file as soon as it's complete
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(['start_time', 'end_time', 'original_text', 'translated_text'])
+
+            async with aiofiles.open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                async for segment in segments:
+                    writer.writerow((
+                        segment['start'],
+                        segment['end'],
+                        segment['text'],
+                        segment['translated_text']
+                    ))
+                    await csvfile.write(buffer.getvalue())
+                    buffer.seek(0)
+                    buffer.truncate(0)
+
+                # Flush the header if no segments arrived
+                remaining = buffer.getvalue()
+                if remaining:
+                    await csvfile.write(remaining)
 
             return output_path
 
@@ -1,12 +1,13 @@
 """Utility modules for the Video Transcriber application."""
 
-from .config import settings, Settings
+from .config import settings, Settings, ensure_ready
 from .file_handler import file_handler, FileHandler
 from .llm_client import llm_client, LLMClient
 
 __all__ = [
     "settings",
     "Settings",
+    "ensure_ready",
     "file_handler",
     "FileHandler",
     "llm_client",
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from dotenv import load_dotenv
@@ -30,10 +31,13 @@ class Settings:
     # File Upload Limits
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "500"))
     MAX_FILE_SIZE_BYTES: int = MAX_FILE_SIZE_MB * 1024 * 1024
-    ALLOWED_VIDEO_FORMATS: List[str] = os.getenv(
+    # Ordered tuple for display/error messages; frozenset for O(1)
+    # membership checks on every upload
+    ALLOWED_VIDEO_FORMATS_DISPLAY: tuple = tuple(os.getenv(
         "ALLOWED_VIDEO_FORMATS",
         "mp4,avi,mov,mkv,webm"
-    ).split(",")
+    ).split(","))
+    ALLOWED_VIDEO_FORMATS: frozenset = frozenset(ALLOWED_VIDEO_FORMATS_DISPLAY)
 
     # Processing Configuration
     CHUNK_SIZE_SECONDS: int = int(os.getenv("CHUNK_SIZE_SECONDS", "60"))
@@ -44,6 +48,16 @@ class Settings:
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-audio-preview")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
 
+    # Requests-per-minute budget per provider; keeps concurrent
+    # translation bursts under the provider quota instead of eating 429s
+    OPENAI_RPM: int = int(os.getenv("OPENAI_RPM", "500"))
+    GEMINI_RPM: int = int(os.getenv("GEMINI_RPM", "60"))
+
+    # Optional tokens-per-minute budget per provider (0 disables the
+    # check); estimated per request from prompt length
+    OPENAI_TPM: int = int(os.getenv("OPENAI_TPM", "0"))
+    GEMINI_TPM: int = int(os.getenv("GEMINI_TPM", "0"))
+
     # Frontend Configuration
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
     CORS_ORIGINS: List[str] = os.getenv(
@@ -52,10 +66,13 @@ class Settings:
     ).split(",")
 
     # Supported Languages
-    SUPPORTED_LANGUAGES: List[str] = os.getenv(
+    # Ordered tuple for display/error messages; frozenset for O(1)
+    # membership checks in the per-segment translate path
+    SUPPORTED_LANGUAGES_DISPLAY: tuple = tuple(os.getenv(
         "SUPPORTED_LANGUAGES",
         "en,zh,hi,es,ar,fr,bn,pt,ru,ur,id,de,ja,mr,te,tr,ta,vi,ko,sw"
-    ).split(",")
+    ).split(","))
+    SUPPORTED_LANGUAGES: frozenset = frozenset(SUPPORTED_LANGUAGES_DISPLAY)
 
     @classmethod
     def validate(cls) -> None:
@@ -110,9 +127,23 @@ class Settings:
 # Create a singleton instance
 settings = Settings()
 
+
+@lru_cache(maxsize=1)
+def ensure_ready() -> None:
+    """Validate configuration and create storage directories.
+
+    Cached so the mkdir syscalls and key checks run once per process no
+    matter how many times config is imported or startup hooks fire.
+
+    Raises:
+        ValueError: If required configuration is missing or invalid
+    """
+    Settings.validate()
+
+
 # Validate configuration on import
 if __name__ != "__main__":
     try:
-        settings.validate()
+        ensure_ready()
     except ValueError as e:
         print(f"Warning: {e}")
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import os
 import uuid
 import aiofiles
@@ -11,6 +13,14 @@ from .config import settings
 class FileHandler:
     """Handles file operations for video uploads and processing."""
 
+    # Uploads at or below this size are written with one thread offload
+    # instead of chunked streaming
+    _SMALL_FILE_BYTES = 8 * 1024 * 1024
+
+    # Serializes manifest read-modify-writes so concurrent registrations
+    # for the same file ID don't lose entries
+    _manifest_lock = asyncio.Lock()
+
     @staticmethod
     def generate_file_id() -> str:
         """Generate a unique file ID using UUID4.
@@ -30,7 +40,7 @@ class FileHandler:
         Returns:
             True if file type is allowed, False otherwise
         """
-        file_extension = filename.split(".")[-1].lower()
+        file_extension = Path(filename).suffix.lstrip(".").lower()
         return file_extension in settings.ALLOWED_VIDEO_FORMATS
 
     @staticmethod
@@ -53,9 +63,10 @@ class FileHandler:
             filename: Name of the file
 
         Returns:
-            File extension without the dot (e.g., 'mp4')
+            File extension without the dot (e.g., 'mp4'), or an empty
+            string if the filename has no extension
         """
-        return filename.split(".")[-1].lower()
+        return Path(filename).suffix.lstrip(".").lower()
 
     @staticmethod
     async def save_upload_file(
@@ -78,7 +89,16 @@ class FileHandler:
         if not FileHandler.validate_file_type(upload_file.filename):
             raise HTTPException(
                 status_code=400,
-                detail=f"File type not allowed. Allowed types: {', '.join(settings.ALLOWED_VIDEO_FORMATS)}"
+                detail=f"File type not allowed. Allowed types: {', '.join(settings.ALLOWED_VIDEO_FORMATS_DISPLAY)}"
+            )
+
+        # Reject declared-oversize uploads before a single byte is read;
+        # the streaming counter below still catches clients that lie
+        declared_size = getattr(upload_file, "size", None)
+        if declared_size is not None and not FileHandler.validate_file_size(declared_size):
+            raise HTTPException(
+                status_code=413,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE_MB}MB"
             )
 
         # Generate file ID if not provided
@@ -90,18 +110,38 @@ class FileHandler:
 
         # Create file path
         file_path = settings.UPLOAD_DIR / f"{file_id}.{file_extension}"
-
-        # Read and validate file size
-        content = await upload_file.read()
-        if not FileHandler.validate_file_size(len(content)):
-            raise HTTPException(
-                status_code=400,
-                detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE_MB}MB"
-            )
-
-        # Save file
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
+        await FileHandler.register_file(file_id, file_path)
+
+        size_error = HTTPException(
+            status_code=400,
+            detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE_MB}MB"
+        )
+
+        # Small files take a single-offload path: one read and one
+        # write_bytes in a worker thread beats dispatching every chunk to
+        # the aiofiles thread pool when the whole file fits in memory
+        # comfortably anyway
+        if declared_size is not None and declared_size <= FileHandler._SMALL_FILE_BYTES:
+            data = await upload_file.read()
+            if not FileHandler.validate_file_size(len(data)):
+                raise size_error
+            await asyncio.to_thread(file_path.write_bytes, data)
+            return file_id, file_path
+
+        # Stream to disk in fixed-size chunks so a 500 MB upload never
+        # sits fully in memory, validating size as bytes arrive
+        total_bytes = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as f:
+                while chunk := await upload_file.read(1 << 20):
+                    total_bytes += len(chunk)
+                    if not FileHandler.validate_file_size(total_bytes):
+                        raise size_error
+                    await f.write(chunk)
+        except HTTPException:
+            # Don't leave a partial upload behind
+            file_path.unlink(missing_ok=True)
+            raise
 
         return file_id, file_path
 
@@ -124,15 +164,78 @@ class FileHandler:
             print(f"Error deleting file {file_path}: {e}")
             return False
 
+    @staticmethod
+    def _manifest_path(file_id: str) -> Path:
+        """Get the path of the manifest file for a file ID.
+
+        Args:
+            file_id: The file ID
+
+        Returns:
+            Path object for the manifest file
+        """
+        return settings.UPLOAD_DIR / f"{file_id}.manifest.json"
+
+    @staticmethod
+    async def register_file(file_id: str, file_path: Path) -> None:
+        """Record a path in the per-ID manifest for later cleanup.
+
+        The manifest lists every file written for a file ID so
+        cleanup_files can unlink them directly instead of glob-scanning
+        four storage directories. Call this from the sites that actually
+        write the file; the read-modify-write runs on a worker thread
+        under a lock so concurrent registrations don't lose entries or
+        block the event loop.
+
+        Args:
+            file_id: The file ID the path belongs to
+            file_path: Path that was written
+        """
+        async with FileHandler._manifest_lock:
+            await asyncio.to_thread(
+                FileHandler._register_file_sync, file_id, file_path
+            )
+
+    @staticmethod
+    def _register_file_sync(file_id: str, file_path: Path) -> None:
+        """Synchronous manifest update backing register_file."""
+        manifest_path = FileHandler._manifest_path(file_id)
+        try:
+            paths = json.loads(manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            paths = []
+
+        entry = str(file_path)
+        if entry not in paths:
+            paths.append(entry)
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            manifest_path.write_text(json.dumps(paths))
+
     @staticmethod
     async def cleanup_files(file_id: str) -> None:
         """Clean up all files associated with a file ID.
 
-        Removes video, audio, transcript, and output files.
+        Removes video, audio, transcript, and output files. Paths
+        recorded in the ID's manifest are unlinked directly; without a
+        manifest this falls back to scanning the storage directories.
 
         Args:
             file_id: The file ID to clean up
         """
+        manifest_path = FileHandler._manifest_path(file_id)
+        if manifest_path.exists():
+            try:
+                paths = json.loads(manifest_path.read_text())
+            except json.JSONDecodeError:
+                paths = []
+
+            # Unlink in parallel; each path is exact, no directory walk
+            await asyncio.gather(
+                *(FileHandler.delete_file(Path(p)) for p in paths)
+            )
+            manifest_path.unlink(missing_ok=True)
+            return
+
         # Patterns to search for
         patterns = [
             settings.UPLOAD_DIR / f"{file_id}.*",
@@ -1,11 +1,106 @@
+import asyncio
+import io
+import json
+import re
+import time
 from pathlib import Path
 from typing import List, Dict, Optional
+import httpx
 import openai
+import orjson
+import tenacity
 from google import genai
+from google.genai import errors as genai_errors
 
 from .config import settings
 
 
+# Models sometimes wrap their "JSON only" answer in markdown code fences
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+# Transient provider failures worth retrying: rate limits, dropped
+# connections, and 5xx responses. Anything else fails fast.
+_RETRYABLE_EXCEPTIONS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    genai_errors.ServerError,
+    httpx.TransportError,
+)
+
+
+# Translation prompt pieces shared by both providers and the batch
+# paths; hoisted so the template is built once instead of re-assembled
+# per segment, and so the wording can't drift between providers.
+_SYSTEM_PROMPT = "You are a professional translator."
+
+_TRANSLATE_TEMPLATE = """You are a professional translator.
+
+Context about the full content: {context}
+
+Translate the following text from {src} to {tgt}.
+Maintain professional tone, cultural nuances, and technical accuracy.
+Only return the translated text, no explanations.
+
+Text to translate:
+"{text}"
+
+Translation:"""
+
+_BATCH_TRANSLATE_TEMPLATE = """You are a professional translator.
+
+Context about the full content: {context}
+
+Translate the following {count} numbered segments from {src} to {tgt}.
+Maintain professional tone, cultural nuances, and technical accuracy.
+Return exactly {count} translations in the same order, separated by a line containing only %%.
+Do not include the numbers or any explanations.
+
+Segments:
+{numbered}
+
+Translations:"""
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter for provider calls.
+
+    Smooths request bursts to the provider's per-minute quota so
+    parallel translation fans out at full speed right up to the limit
+    instead of tripping 429s and paying retry backoff.
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self._capacity = float(rate_per_minute)
+        self._tokens = float(rate_per_minute)
+        self._rate = rate_per_minute / 60.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, sleeping until it refills if short.
+
+        Args:
+            tokens: Cost of this acquisition — 1 for request counting,
+                or an estimated token total for TPM budgets. Capped at
+                the bucket capacity so an oversized request waits for a
+                full bucket instead of forever.
+        """
+        cost = min(float(tokens), self._capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                await asyncio.sleep((cost - self._tokens) / self._rate)
+
+
 class LLMClient:
     """Client for interacting with LLM APIs (OpenAI and Gemini)."""
 
@@ -14,14 +109,104 @@ class LLMClient:
         self.openai_client = None
         self.gemini_client = None
 
-        # Initialize OpenAI client if API key is available
+        # Shared connection pool: keep-alive connections amortize the
+        # TLS/TCP handshake across the many back-to-back calls a single
+        # transcript generates
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(
+                max_connections=settings.MAX_CONCURRENT_JOBS * 4,
+                max_keepalive_connections=settings.MAX_CONCURRENT_JOBS * 2
+            )
+        )
+
+        # Initialize OpenAI client if API key is available. The async
+        # client keeps the event loop free during HTTP round-trips so
+        # concurrent segment translations actually overlap.
         if settings.OPENAI_API_KEY:
-            self.openai_client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+            self.openai_client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self._http
+            )
 
         # Initialize Gemini client if API key is available
         if settings.GEMINI_API_KEY:
             self.gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
+        # Per-provider rate limiters sized from the configured RPM quotas
+        self._openai_limiter = _TokenBucket(settings.OPENAI_RPM)
+        self._gemini_limiter = _TokenBucket(settings.GEMINI_RPM)
+
+        # Optional tokens-per-minute tier; disabled unless a TPM quota
+        # is configured
+        self._openai_tpm = _TokenBucket(settings.OPENAI_TPM) if settings.OPENAI_TPM > 0 else None
+        self._gemini_tpm = _TokenBucket(settings.GEMINI_TPM) if settings.GEMINI_TPM > 0 else None
+
+    @staticmethod
+    async def _with_retry(
+        call,
+        *args,
+        _limiter: Optional[_TokenBucket] = None,
+        _tpm_limiter: Optional[_TokenBucket] = None,
+        _token_estimate: int = 0,
+        **kwargs
+    ):
+        """Invoke an async provider call with rate limiting and retries.
+
+        Each attempt first takes a token from the provider's bucket (and
+        the estimated cost from the TPM bucket when one is configured),
+        then retries up to 5 attempts on transient errors (429s, dropped
+        connections, 5xx) with randomized exponential backoff, turning
+        provider hiccups into latency instead of failed transcripts.
+
+        Args:
+            call: Async callable to invoke
+            *args: Positional arguments for the call
+            _limiter: Optional request-per-minute bucket charged once
+                per attempt
+            _tpm_limiter: Optional tokens-per-minute bucket charged with
+                _token_estimate per attempt
+            _token_estimate: Estimated token cost of this request
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            Whatever the call returns
+
+        Raises:
+            Exception: The last error if all attempts fail, or
+                immediately for non-retryable errors
+        """
+        async for attempt in tenacity.AsyncRetrying(
+            stop=tenacity.stop_after_attempt(5),
+            wait=tenacity.wait_random_exponential(min=1, max=30),
+            retry=tenacity.retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
+            reraise=True
+        ):
+            with attempt:
+                if _limiter is not None:
+                    await _limiter.acquire()
+                if _tpm_limiter is not None and _token_estimate > 0:
+                    await _tpm_limiter.acquire(_token_estimate)
+                return await call(*args, **kwargs)
+
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """Estimate the token cost of a prompt plus its response.
+
+        Four characters per token is the usual rule of thumb; a flat
+        output allowance is added since translations are roughly the
+        length of their input.
+        """
+        return len(prompt) // 4 + 512
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool.
+
+        Call this on application shutdown so keep-alive connections are
+        released cleanly.
+        """
+        await self._http.aclose()
+
     async def transcribe_audio(
         self,
         audio_file_path: Path,
@@ -68,10 +253,11 @@ class LLMClient:
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
 
-        try:
+        async def _transcribe():
+            # Reopen per attempt so a retry never resumes from EOF
             with open(audio_file_path, "rb") as audio_file:
                 # Use OpenAI audio transcription with timestamp option
-                response = self.openai_client.audio.transcriptions.create(
+                return await self.openai_client.audio.transcriptions.create(
                     model=settings.OPENAI_MODEL,
                     file=audio_file,
                     language=language,
@@ -79,6 +265,9 @@ class LLMClient:
                     timestamp_granularities=["segment"]
                 )
 
+        try:
+            response = await self._with_retry(_transcribe, _limiter=self._openai_limiter)
+
             # Parse response and extract segments
             segments = []
             if hasattr(response, 'segments') and response.segments:
@@ -118,10 +307,15 @@ class LLMClient:
         if not self.gemini_client:
             raise ValueError("Gemini API key not configured")
 
+        uploaded = None
         try:
-            # Upload audio file
-            with open(audio_file_path, "rb") as audio_file:
-                audio_data = audio_file.read()
+            # Upload through the Files API instead of inlining the audio:
+            # inline_data base64-encodes the whole file into the JSON
+            # body (~4/3 the audio size in memory); the upload streams
+            # from disk and the file handle is reusable across retries
+            uploaded = await self.gemini_client.aio.files.upload(
+                file=str(audio_file_path)
+            )
 
             # Create prompt for transcription with timestamps
             prompt = f"""Transcribe this audio file in {language} language.
@@ -130,30 +324,36 @@ class LLMClient:
 
             Only return the JSON array, no additional text."""
 
-            # Use Gemini model for transcription
-            response = self.gemini_client.models.generate_content(
+            # Use Gemini model for transcription (async API keeps the
+            # event loop unblocked during the upload + inference)
+            response = await self._with_retry(
+                self.gemini_client.aio.models.generate_content,
+                _limiter=self._gemini_limiter,
                 model=settings.GEMINI_MODEL,
-                contents=[
-                    {
-                        "parts": [
-                            {"text": prompt},
-                            {"inline_data": {
-                                "mime_type": "audio/wav",
-                                "data": audio_data
-                            }}
-                        ]
-                    }
-                ]
+                contents=[prompt, uploaded]
             )
 
-            # Parse response
-            import json
-            segments = json.loads(response.text)
+            # Parse response after stripping any code fences; orjson is
+            # several times faster than stdlib json on large transcripts,
+            # with a stdlib fallback for NaN/Infinity which orjson rejects
+            text = _FENCE_RE.sub('', response.text)
+            try:
+                segments = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                segments = json.loads(text)
             return segments
 
         except Exception as e:
             raise Exception(f"Gemini transcription failed: {str(e)}")
 
+        finally:
+            # Don't leave the uploaded audio in Gemini file storage
+            if uploaded is not None:
+                try:
+                    await self.gemini_client.aio.files.delete(name=uploaded.name)
+                except Exception:
+                    pass
+
     async def translate_with_context(
         self,
         text: str,
@@ -191,6 +391,199 @@ class LLMClient:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
+    async def translate_batch_with_context(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        context: str,
+        provider: Optional[str] = None
+    ) -> List[str]:
+        """Translate several texts in a single LLM call.
+
+        Packs the texts into one numbered prompt with a %% separator
+        protocol, amortizing the system/context token prefix across the
+        whole batch instead of paying it once per segment.
+
+        Args:
+            texts: Texts to translate, in order
+            source_language: Source language code (ISO 639-1)
+            target_language: Target language code (ISO 639-1)
+            context: Context about the full content for better translation
+            provider: LLM provider to use ('openai' or 'gemini'). If None, uses default.
+
+        Returns:
+            Translated texts in the same order as the input
+
+        Raises:
+            ValueError: If the provider is unknown or the response doesn't
+                align with the input count (callers should fall back to
+                per-segment translation)
+            Exception: If translation fails
+        """
+        provider = provider or settings.DEFAULT_LLM_PROVIDER
+
+        numbered = "\n".join(f"{i + 1}) {text}" for i, text in enumerate(texts))
+        prompt = _BATCH_TRANSLATE_TEMPLATE.format_map({
+            'context': context,
+            'count': len(texts),
+            'src': source_language,
+            'tgt': target_language,
+            'numbered': numbered
+        })
+
+        if provider == "openai":
+            if not self.openai_client:
+                raise ValueError("OpenAI API key not configured")
+            response = await self._with_retry(
+                self.openai_client.chat.completions.create,
+                _limiter=self._openai_limiter,
+                _tpm_limiter=self._openai_tpm,
+                _token_estimate=self._estimate_tokens(prompt),
+                model=settings.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3
+            )
+            raw = response.choices[0].message.content
+        elif provider == "gemini":
+            if not self.gemini_client:
+                raise ValueError("Gemini API key not configured")
+            response = await self._with_retry(
+                self.gemini_client.aio.models.generate_content,
+                _limiter=self._gemini_limiter,
+                _tpm_limiter=self._gemini_tpm,
+                _token_estimate=self._estimate_tokens(prompt),
+                model=settings.GEMINI_MODEL,
+                contents=prompt
+            )
+            raw = response.text
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        translations = [part.strip() for part in raw.strip().split("\n%%\n")]
+        if len(translations) != len(texts):
+            raise ValueError(
+                f"Batch translation returned {len(translations)} segments, expected {len(texts)}"
+            )
+
+        return translations
+
+    async def translate_batch_api(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        context: str,
+        timeout: float = 24 * 60 * 60,
+        poll_interval: float = 30.0
+    ) -> List[str]:
+        """Translate texts through the OpenAI Batch API.
+
+        Intended for large offline jobs with no interactive latency
+        requirement: batch jobs cost roughly half the synchronous price
+        and run under separate, higher rate limits. Each text becomes one
+        chat-completion request in an uploaded JSONL file; results are
+        re-associated by custom_id once the batch completes.
+
+        Args:
+            texts: Texts to translate, in order
+            source_language: Source language code (ISO 639-1)
+            target_language: Target language code (ISO 639-1)
+            context: Context about the full content for better translation
+            timeout: Maximum seconds to wait for the batch to complete
+            poll_interval: Initial seconds between status polls (grows
+                exponentially up to 5 minutes)
+
+        Returns:
+            Translated texts in the same order as the input
+
+        Raises:
+            ValueError: If the OpenAI client is not configured
+            TimeoutError: If the batch doesn't complete within timeout
+            Exception: If the batch fails or expires
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI API key not configured")
+
+        # One chat-completion request per segment, keyed by custom_id
+        lines = []
+        for i, text in enumerate(texts):
+            prompt = _TRANSLATE_TEMPLATE.format_map({
+                'context': context,
+                'src': source_language,
+                'tgt': target_language,
+                'text': text
+            })
+            lines.append(orjson.dumps({
+                "custom_id": f"seg_{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.OPENAI_MODEL,
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.3
+                }
+            }))
+
+        try:
+            input_file = await self.openai_client.files.create(
+                file=io.BytesIO(b"\n".join(lines)),
+                purpose="batch"
+            )
+
+            batch = await self.openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            # Poll with exponential backoff until the batch resolves
+            deadline = time.monotonic() + timeout
+            delay = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Batch {batch.id} did not complete within {timeout}s "
+                        f"(status: {batch.status})"
+                    )
+                await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                delay = min(delay * 2, 300.0)
+                batch = await self.openai_client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                raise Exception(f"Batch {batch.id} ended with status '{batch.status}'")
+
+            # Download results and re-associate by custom_id; output order
+            # is not guaranteed to match input order. The JSONL payload
+            # grows with the batch size, so parse each line with orjson.
+            output = await self.openai_client.files.content(batch.output_file_id)
+            by_id: Dict[str, str] = {}
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                result = orjson.loads(line)
+                body = result["response"]["body"]
+                by_id[result["custom_id"]] = body["choices"][0]["message"]["content"].strip()
+
+            missing = [i for i in range(len(texts)) if f"seg_{i}" not in by_id]
+            if missing:
+                raise Exception(
+                    f"Batch {batch.id} returned no result for segments: {missing}"
+                )
+
+            return [by_id[f"seg_{i}"] for i in range(len(texts))]
+
+        except (ValueError, TimeoutError):
+            raise
+        except Exception as e:
+            raise Exception(f"OpenAI batch translation failed: {str(e)}")
+
     async def _translate_with_openai(
         self,
         text: str,
@@ -213,23 +606,21 @@ class LLMClient:
             raise ValueError("OpenAI API key not configured")
 
         try:
-            prompt = f"""You are a professional translator.
-
-Context about the full content: {context}
-
-Translate the following text from {source_language} to {target_language}.
-Maintain professional tone, cultural nuances, and technical accuracy.
-Only return the translated text, no explanations.
-
-Text to translate:
-"{text}"
-
-Translation:"""
-
-            response = self.openai_client.chat.completions.create(
+            prompt = _TRANSLATE_TEMPLATE.format_map({
+                'context': context,
+                'src': source_language,
+                'tgt': target_language,
+                'text': text
+            })
+
+            response = await self._with_retry(
+                self.openai_client.chat.completions.create,
+                _limiter=self._openai_limiter,
+                _tpm_limiter=self._openai_tpm,
+                _token_estimate=self._estimate_tokens(prompt),
                 model=settings.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a professional translator."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3
@@ -262,20 +653,18 @@ Translation:"""
             raise ValueError("Gemini API key not configured")
 
         try:
-            prompt = f"""You are a professional translator.
-
-Context about the full content: {context}
-
-Translate the following text from {source_language} to {target_language}.
-Maintain professional tone, cultural nuances, and technical accuracy.
-Only return the translated text, no explanations.
-
-Text to translate:
-"{text}"
-
-Translation:"""
-
-            response = self.gemini_client.models.generate_content(
+            prompt = _TRANSLATE_TEMPLATE.format_map({
+                'context': context,
+                'src': source_language,
+                'tgt': target_language,
+                'text': text
+            })
+
+            response = await self._with_retry(
+                self.gemini_client.aio.models.generate_content,
+                _limiter=self._gemini_limiter,
+                _tpm_limiter=self._gemini_tpm,
+                _token_estimate=self._estimate_tokens(prompt),
                 model=settings.GEMINI_MODEL,
                 contents=prompt
             )
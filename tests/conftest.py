@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the test suite.
+
+The service layer already exposes one module-level singleton per service
+(`translator`, `transcriber`, `context_builder`), and Python's module
+cache guarantees every test file that imports them gets the same
+instance — so the httpx pool and provider clients are built once per
+worker regardless of how many files import them. The fixtures below
+expose those singletons for tests that prefer injection over imports,
+and the autouse finalizer releases the shared LLM connection pool at
+the end of the session instead of leaking keep-alive sockets.
+"""
+
+import pytest
+import pytest_asyncio
+
+from backend.app.services.context_builder import context_builder
+from backend.app.services.transcriber import transcriber
+from backend.app.services.translator import translator
+
+# The services import utils as `app.utils.*` (backend/ is on sys.path),
+# so the singleton they share lives in that module object — importing it
+# as `backend.app.utils.llm_client` here would create a second client
+# and leave the real pool open at session end
+from app.utils.llm_client import llm_client
+
+
+@pytest.fixture(scope="session")
+def translator_svc():
+    """Session-wide Translator service (the module singleton)."""
+    return translator
+
+
+@pytest.fixture(scope="session")
+def transcriber_svc():
+    """Session-wide Transcriber service (the module singleton)."""
+    return transcriber
+
+
+@pytest.fixture(scope="session")
+def context_builder_svc():
+    """Session-wide ContextBuilder service (the module singleton)."""
+    return context_builder
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _close_llm_pool():
+    """Close the shared LLM HTTP connection pool after the session."""
+    yield
+    await llm_client.aclose()
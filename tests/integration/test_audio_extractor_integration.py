@@ -8,84 +8,97 @@ Run with: pytest tests/integration/test_audio_extractor_integration.py -v -s
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import os
 from pathlib import Path
+import subprocess
 import tempfile
 import shutil
-import numpy as np
-from pydub import AudioSegment
+import wave
 
 from backend.app.services.audio_extractor import audio_extractor
 
+# Keep the FFmpeg-heavy tests on one xdist worker (run with
+# pytest -n auto --dist loadgroup) so they share the cached sample video
+# and don't compete with the network-bound LLM tests for cores
+pytestmark = pytest.mark.xdist_group("ffmpeg")
+
+
+@pytest.fixture(scope="session")
+def ffmpeg_threads():
+    """Per-process FFmpeg decode thread cap for this test session.
+
+    Under pytest-xdist the workers run FFmpeg concurrently, so divide
+    the cores between them instead of letting every process claim the
+    whole machine. The cap is passed to the extraction calls explicitly
+    because the extractor reads AITOD_FFMPEG_THREADS at import time,
+    before any fixture could export it.
+    """
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if workers <= 1:
+        return None
+    return max(1, (os.cpu_count() or workers) // workers)
+
+
+@pytest.fixture(scope="session")
+def sample_video_with_audio():
+    """Create a sample video file with audio for testing.
+
+    Synthesized once per session by FFmpeg's lavfi sources (5s of black
+    video plus a 440 Hz tone) and cached in the system temp directory,
+    so repeated runs skip the encode entirely. The tone is generated at
+    16 kHz mono — the extractor's target format — so there are ~2.75x
+    fewer audio samples to encode here and decode/resample later.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        pytest.skip("FFmpeg not installed")
+
+    video_path = Path(tempfile.gettempdir()) / "aitod_sample_16k.mp4"
+    if video_path.exists():
+        return video_path
+
+    try:
+        subprocess.run(
+            [
+                ffmpeg, "-y",
+                "-f", "lavfi", "-i", "color=c=black:s=640x480:d=5:r=24",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=5:sample_rate=16000",
+                "-c:v", "libx264", "-preset", "ultrafast",
+                "-c:a", "aac", "-ac", "1", "-shortest",
+                str(video_path)
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except subprocess.CalledProcessError as e:
+        pytest.skip(f"Could not create sample video: {str(e)}")
+
+    return video_path
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def extracted_audio_wav(sample_video_with_audio, tmp_path_factory, ffmpeg_threads):
+    """Extract audio from the sample video once for the whole module.
+
+    Every FFmpeg invocation costs a process spawn plus a decode, so
+    tests that only need *an* extracted WAV share this artifact instead
+    of re-extracting per test.
+    """
+    output_path = tmp_path_factory.mktemp("extracted") / "audio.wav"
+    return await audio_extractor.extract_audio(
+        sample_video_with_audio, output_path, ffmpeg_threads=ffmpeg_threads
+    )
+
 
 class TestAudioExtractorIntegration:
     """Integration tests for audio extraction functionality."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        # Cleanup after test
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
-
-    @pytest.fixture
-    def sample_video_with_audio(self, temp_dir):
-        """Create a sample video file with audio for testing."""
-        video_path = temp_dir / "sample_video.mp4"
-
-        try:
-            import moviepy.editor as mp
-
-            # Create a 5-second black video with a tone
-            def make_frame(t):
-                return np.zeros((480, 640, 3), dtype=np.uint8)
-
-            # Create video clip
-            video = mp.VideoClip(make_frame, duration=5)
-            video.fps = 24
-
-            # Create audio (sine wave)
-            audio_freq = 440  # A4 note
-            sample_rate = 44100
-            duration = 5
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            audio_data = np.sin(2 * np.pi * audio_freq * t)
-
-            # Create audio clip
-            from moviepy.audio.AudioClip import AudioClip
-            def make_audio(t):
-                idx = int(t * sample_rate)
-                if idx < len(audio_data):
-                    return audio_data[idx]
-                return 0
-
-            audio = AudioClip(make_audio, duration=duration, fps=sample_rate)
-            video_with_audio = video.set_audio(audio)
-
-            # Write video file
-            video_with_audio.write_videofile(
-                str(video_path),
-                codec="libx264",
-                audio_codec="aac",
-                fps=24,
-                verbose=False,
-                logger=None
-            )
-
-            # Cleanup
-            video.close()
-            audio.close()
-            video_with_audio.close()
-
-            return video_path
-
-        except Exception as e:
-            pytest.skip(f"Could not create sample video: {str(e)}")
 
     @pytest.mark.asyncio
-    async def test_extract_audio_from_video(self, temp_dir, sample_video_with_audio):
+    async def test_extract_audio_from_video(self, tmp_path, sample_video_with_audio, ffmpeg_threads):
         """Test extracting audio from a real video file."""
         print(f"\n\nTest: Extracting audio from video")
         print(f"Video path: {sample_video_with_audio}")
@@ -93,12 +106,13 @@ class TestAudioExtractorIntegration:
         if not sample_video_with_audio.exists():
             pytest.skip("Sample video not available")
 
-        output_path = temp_dir / "extracted_audio.wav"
+        output_path = tmp_path / "extracted_audio.wav"
 
         # Extract audio
         result_path = await audio_extractor.extract_audio(
             sample_video_with_audio,
-            output_path
+            output_path,
+            ffmpeg_threads=ffmpeg_threads
         )
 
         print(f"Audio extracted to: {result_path}")
@@ -108,21 +122,26 @@ class TestAudioExtractorIntegration:
         assert result_path.suffix == ".wav", "Audio file is not WAV format"
         assert result_path.stat().st_size > 0, "Audio file is empty"
 
-        # Verify audio properties
-        audio = AudioSegment.from_wav(str(result_path))
-        print(f"Audio duration: {audio.duration_seconds:.2f}s")
-        print(f"Sample rate: {audio.frame_rate}Hz")
-        print(f"Channels: {audio.channels}")
+        # Verify audio properties from the WAV header alone; no need to
+        # decode the whole payload just to read format metadata
+        with wave.open(str(result_path), 'rb') as wav:
+            frame_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            duration_seconds = wav.getnframes() / frame_rate
+
+        print(f"Audio duration: {duration_seconds:.2f}s")
+        print(f"Sample rate: {frame_rate}Hz")
+        print(f"Channels: {channels}")
 
-        assert audio.duration_seconds > 4, "Audio duration is too short"
-        assert audio.duration_seconds < 6, "Audio duration is too long"
-        assert audio.frame_rate == 16000, "Audio sample rate is not 16kHz"
-        assert audio.channels == 1, "Audio is not mono"
+        assert duration_seconds > 4, "Audio duration is too short"
+        assert duration_seconds < 6, "Audio duration is too long"
+        assert frame_rate == 16000, "Audio sample rate is not 16kHz"
+        assert channels == 1, "Audio is not mono"
 
         print("✓ Audio extraction successful\n")
 
     @pytest.mark.asyncio
-    async def test_extract_audio_with_file_id(self, temp_dir, sample_video_with_audio):
+    async def test_extract_audio_with_file_id(self, tmp_path, sample_video_with_audio, ffmpeg_threads):
         """Test extracting audio using file_id parameter."""
         print(f"\n\nTest: Extract audio with file_id")
 
@@ -134,7 +153,8 @@ class TestAudioExtractorIntegration:
         # Extract audio using file_id
         result_path = await audio_extractor.extract_audio(
             sample_video_with_audio,
-            file_id=file_id
+            file_id=file_id,
+            ffmpeg_threads=ffmpeg_threads
         )
 
         print(f"Audio extracted to: {result_path}")
@@ -146,19 +166,12 @@ class TestAudioExtractorIntegration:
         print("✓ Audio extraction with file_id successful\n")
 
     @pytest.mark.asyncio
-    async def test_get_audio_duration_from_extracted(self, temp_dir, sample_video_with_audio):
+    async def test_get_audio_duration_from_extracted(self, extracted_audio_wav):
         """Test getting duration from extracted audio file."""
         print(f"\n\nTest: Get audio duration")
 
-        if not sample_video_with_audio.exists():
-            pytest.skip("Sample video not available")
-
-        # First extract audio
-        audio_path = temp_dir / "audio.wav"
-        await audio_extractor.extract_audio(sample_video_with_audio, audio_path)
-
-        # Get duration
-        duration = await audio_extractor.get_audio_duration(audio_path)
+        # Get duration from the shared extracted artifact
+        duration = await audio_extractor.get_audio_duration(extracted_audio_wav)
 
         print(f"Audio duration: {duration:.2f}s")
 
@@ -168,7 +181,28 @@ class TestAudioExtractorIntegration:
         print("✓ Duration extraction successful\n")
 
     @pytest.mark.asyncio
-    async def test_extract_audio_formats(self, temp_dir):
+    async def test_get_audio_duration_from_video(self, sample_video_with_audio):
+        """Test probing duration straight from the video container.
+
+        Pure-duration checks don't need the PCM round-trip through an
+        extracted WAV: FFprobe streams the format metadata over a pipe
+        and no audio bytes touch disk.
+        """
+        print(f"\n\nTest: Get duration directly from video")
+
+        if shutil.which("ffprobe") is None:
+            pytest.skip("FFprobe not installed")
+
+        duration = await audio_extractor.get_audio_duration(sample_video_with_audio)
+
+        print(f"Video duration: {duration:.2f}s")
+
+        assert 4.5 <= duration <= 5.5, f"Duration {duration}s is not close to expected 5s"
+
+        print("✓ Direct duration probe successful\n")
+
+    @pytest.mark.asyncio
+    async def test_extract_audio_formats(self, tmp_path):
         """Test audio extraction from different video formats."""
         print(f"\n\nTest: Extract audio from different formats")
 
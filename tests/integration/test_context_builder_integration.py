@@ -10,197 +10,233 @@ Run with: pytest tests/integration/test_context_builder_integration.py -v -s
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import functools
+import re
 from pathlib import Path
-import tempfile
-import shutil
 
-from backend.app.services.context_builder import context_builder
+from backend.app.services.context_builder import get_context_builder
 from backend.app.services.transcriber import transcriber
+from backend.app.utils import settings
+
+# Group the LLM-bound tests on one xdist worker (run with
+# pytest -n auto --dist loadgroup) so they share the session-scoped
+# llm_contexts fixture instead of rebuilding it per worker
+pytestmark = pytest.mark.xdist_group("llm")
+
+# Topic keyword checks as single compiled alternations: one SRE pass
+# instead of k substring scans, and IGNORECASE replaces the .lower() copy
+_TECH_RE = re.compile(r"machine learning|neural|network|tutorial|brain", re.IGNORECASE)
+_COOK_RE = re.compile(r"cook|recipe|bake|cake|food|kitchen", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def tech_tutorial_segments():
+    """Sample segments from a technical tutorial."""
+    return [
+        {"start": 0.0, "end": 5.0, "text": "Welcome to this tutorial on machine learning."},
+        {"start": 5.0, "end": 10.0, "text": "Today we will explore neural networks."},
+        {"start": 10.0, "end": 15.0, "text": "Neural networks are computational models inspired by the human brain."},
+        {"start": 15.0, "end": 20.0, "text": "They consist of interconnected layers of nodes called neurons."},
+        {"start": 20.0, "end": 25.0, "text": "Each neuron processes input data and passes it to the next layer."},
+        {"start": 25.0, "end": 30.0, "text": "Training involves adjusting weights to minimize prediction errors."}
+    ]
+
+
+@pytest.fixture(scope="session")
+def cooking_video_segments():
+    """Sample segments from a cooking video."""
+    return [
+        {"start": 0.0, "end": 3.0, "text": "Hello everyone, today we're making chocolate cake."},
+        {"start": 3.0, "end": 6.0, "text": "First, preheat your oven to 350 degrees."},
+        {"start": 6.0, "end": 9.0, "text": "Mix flour, sugar, cocoa powder, and baking soda."},
+        {"start": 9.0, "end": 12.0, "text": "Add eggs, milk, oil, and vanilla extract."},
+        {"start": 12.0, "end": 15.0, "text": "Pour the batter into a greased pan and bake for 30 minutes."}
+    ]
+
+
+@pytest.fixture(scope="session")
+def openai_available():
+    """Probe OpenAI key availability once per session.
+
+    Tests skip on this flag up front instead of each paying the full
+    build_context dispatch just to catch a missing-key ValueError.
+    """
+    return bool(settings.OPENAI_API_KEY)
+
+
+@pytest.fixture(scope="session")
+def gemini_available():
+    """Probe Gemini key availability once per session."""
+    return bool(settings.GEMINI_API_KEY)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def llm_contexts(tech_tutorial_segments, cooking_video_segments,
+                       openai_available, gemini_available):
+    """Build every LLM context the tests need in one concurrent burst.
+
+    The context tests are dominated by network round-trips, so the
+    independent build_context calls are fired together with gather and
+    memoized for the whole session; tests only index this dict and
+    assert. Failed calls are stored as exceptions for the consuming
+    test to skip or raise on. Providers without a configured key are
+    short-circuited to a placeholder error without any dispatch.
+    """
+    _missing = ValueError("API key not configured")
+    jobs = {
+        "tech_openai": (openai_available, tech_tutorial_segments, "openai"),
+        "tech_gemini": (gemini_available, tech_tutorial_segments, "gemini"),
+        "cooking_gemini": (gemini_available, cooking_video_segments, "gemini"),
+    }
+    cb = get_context_builder()
+    live = {
+        key: cb.build_context(segments, source_language="en", provider=provider)
+        for key, (available, segments, provider) in jobs.items() if available
+    }
+    results = dict(zip(live, await asyncio.gather(*live.values(), return_exceptions=True)))
+    return {key: results.get(key, _missing) for key in jobs}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tech_csv(tmp_path_factory, tech_tutorial_segments):
+    """Write the canonical tech-tutorial transcript CSV once per session."""
+    csv_path = tmp_path_factory.mktemp("csv") / "transcript.csv"
+    await transcriber.save_transcript_to_csv(tech_tutorial_segments, csv_path)
+    return csv_path
+
+
+@functools.lru_cache(maxsize=None)
+def _simple_context_cached(segment_key):
+    """Build a simple context once per distinct segment list.
+
+    Keyed on a hashable (start, end, text) tuple so tests sharing the
+    same fixture reuse one build_simple_context result.
+    """
+    segments = [{"start": s, "end": e, "text": t} for s, e, t in segment_key]
+    return get_context_builder().build_simple_context(segments)
+
+
+def _simple_context(segments):
+    """Memoized wrapper around context_builder.build_simple_context."""
+    return _simple_context_cached(
+        tuple((s["start"], s["end"], s["text"]) for s in segments)
+    )
+
+
+def _unwrap_context(result):
+    """Return a built context, skipping or raising on stored failures."""
+    if isinstance(result, ValueError) and "API key" in str(result):
+        pytest.skip("API key not configured")
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
 
 class TestContextBuilderIntegration:
     """Integration tests for context building functionality."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        # Cleanup after test
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
-
-    @pytest.fixture
-    def tech_tutorial_segments(self):
-        """Sample segments from a technical tutorial."""
-        return [
-            {"start": 0.0, "end": 5.0, "text": "Welcome to this tutorial on machine learning."},
-            {"start": 5.0, "end": 10.0, "text": "Today we will explore neural networks."},
-            {"start": 10.0, "end": 15.0, "text": "Neural networks are computational models inspired by the human brain."},
-            {"start": 15.0, "end": 20.0, "text": "They consist of interconnected layers of nodes called neurons."},
-            {"start": 20.0, "end": 25.0, "text": "Each neuron processes input data and passes it to the next layer."},
-            {"start": 25.0, "end": 30.0, "text": "Training involves adjusting weights to minimize prediction errors."}
-        ]
-
-    @pytest.fixture
-    def cooking_video_segments(self):
-        """Sample segments from a cooking video."""
-        return [
-            {"start": 0.0, "end": 3.0, "text": "Hello everyone, today we're making chocolate cake."},
-            {"start": 3.0, "end": 6.0, "text": "First, preheat your oven to 350 degrees."},
-            {"start": 6.0, "end": 9.0, "text": "Mix flour, sugar, cocoa powder, and baking soda."},
-            {"start": 9.0, "end": 12.0, "text": "Add eggs, milk, oil, and vanilla extract."},
-            {"start": 12.0, "end": 15.0, "text": "Pour the batter into a greased pan and bake for 30 minutes."}
-        ]
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_build_context_with_openai(self, tech_tutorial_segments):
+    async def test_build_context_with_openai(self, llm_contexts):
         """Test context building using OpenAI API."""
         print(f"\n\nTest: Build context with OpenAI")
-        print(f"Number of segments: {len(tech_tutorial_segments)}")
-
-        try:
-            context = await context_builder.build_context(
-                tech_tutorial_segments,
-                source_language="en",
-                provider="openai"
-            )
-
-            print(f"\nGenerated Context:")
-            print(f"{context}")
-            print(f"\nContext length: {len(context)} characters")
-
-            # Verify context was generated
-            assert isinstance(context, str), "Context should be a string"
-            assert len(context) > 0, "Context should not be empty"
-            assert len(context) < 500, "Context should be concise (< 500 chars)"
-
-            # Check if context contains key concepts
-            context_lower = context.lower()
-            # Should mention something about the topic
-            has_topic_mention = any(word in context_lower for word in ["machine learning", "neural", "network", "tutorial", "brain"])
-
-            print(f"\nContext mentions topic: {has_topic_mention}")
-            print("✓ OpenAI context building successful\n")
-
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("OpenAI API key not configured")
-            raise
-        except Exception as e:
-            print(f"✗ OpenAI context building failed: {str(e)}")
-            raise
+
+        context = _unwrap_context(llm_contexts["tech_openai"])
+
+        print(f"\nGenerated Context:")
+        print(f"{context}")
+        print(f"\nContext length: {len(context)} characters")
+
+        # Verify context was generated
+        assert isinstance(context, str), "Context should be a string"
+        assert len(context) > 0, "Context should not be empty"
+        assert len(context) < 500, "Context should be concise (< 500 chars)"
+
+        # Check if context contains key concepts
+        # Should mention something about the topic
+        has_topic_mention = bool(_TECH_RE.search(context))
+
+        print(f"\nContext mentions topic: {has_topic_mention}")
+        print("✓ OpenAI context building successful\n")
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_build_context_with_gemini(self, tech_tutorial_segments):
+    async def test_build_context_with_gemini(self, llm_contexts):
         """Test context building using Gemini API."""
         print(f"\n\nTest: Build context with Gemini")
-        print(f"Number of segments: {len(tech_tutorial_segments)}")
-
-        try:
-            context = await context_builder.build_context(
-                tech_tutorial_segments,
-                source_language="en",
-                provider="gemini"
-            )
-
-            print(f"\nGenerated Context:")
-            print(f"{context}")
-            print(f"\nContext length: {len(context)} characters")
-
-            # Verify context
-            assert isinstance(context, str)
-            assert len(context) > 0
-            assert len(context) < 500
-
-            # Check for topic relevance
-            context_lower = context.lower()
-            has_topic_mention = any(word in context_lower for word in ["machine learning", "neural", "network", "tutorial", "brain"])
-
-            print(f"\nContext mentions topic: {has_topic_mention}")
-            print("✓ Gemini context building successful\n")
-
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("Gemini API key not configured")
-            raise
-        except Exception as e:
-            print(f"✗ Gemini context building failed: {str(e)}")
-            raise
+
+        context = _unwrap_context(llm_contexts["tech_gemini"])
+
+        print(f"\nGenerated Context:")
+        print(f"{context}")
+        print(f"\nContext length: {len(context)} characters")
+
+        # Verify context
+        assert isinstance(context, str)
+        assert len(context) > 0
+        assert len(context) < 500
+
+        # Check for topic relevance
+        has_topic_mention = bool(_TECH_RE.search(context))
+
+        print(f"\nContext mentions topic: {has_topic_mention}")
+        print("✓ Gemini context building successful\n")
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_build_context_different_topics(self, cooking_video_segments):
+    async def test_build_context_different_topics(self, llm_contexts):
         """Test context building with different content types."""
         print(f"\n\nTest: Build context for cooking video")
 
-        try:
-            context = await context_builder.build_context(
-                cooking_video_segments,
-                source_language="en",
-                provider="gemini"
-            )
-
-            print(f"\nGenerated Context:")
-            print(f"{context}")
+        context = _unwrap_context(llm_contexts["cooking_gemini"])
 
-            # Verify context
-            assert isinstance(context, str)
-            assert len(context) > 0
+        print(f"\nGenerated Context:")
+        print(f"{context}")
 
-            # Check for cooking/recipe related terms
-            context_lower = context.lower()
-            has_cooking_terms = any(word in context_lower for word in ["cook", "recipe", "bake", "cake", "food", "kitchen"])
+        # Verify context
+        assert isinstance(context, str)
+        assert len(context) > 0
 
-            print(f"\nContext mentions cooking: {has_cooking_terms}")
-            print("✓ Different topic context building successful\n")
+        # Check for cooking/recipe related terms
+        has_cooking_terms = bool(_COOK_RE.search(context))
 
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("API key not configured")
-            raise
+        print(f"\nContext mentions cooking: {has_cooking_terms}")
+        print("✓ Different topic context building successful\n")
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_build_context_from_csv_file(self, temp_dir, tech_tutorial_segments):
+    async def test_build_context_from_csv_file(self, tech_csv, gemini_available):
         """Test building context from a CSV file."""
         print(f"\n\nTest: Build context from CSV file")
+        print(f"CSV fixture: {tech_csv}")
 
-        # Save segments to CSV
-        csv_path = temp_dir / "transcript.csv"
-        await transcriber.save_transcript_to_csv(tech_tutorial_segments, csv_path)
-        print(f"CSV saved to: {csv_path}")
-
-        try:
-            context = await context_builder.build_context_from_file(
-                csv_path,
-                source_language="en",
-                provider="gemini"
-            )
+        if not gemini_available:
+            pytest.skip("GEMINI_API_KEY not configured")
 
-            print(f"\nGenerated Context from CSV:")
-            print(f"{context}")
+        context = await get_context_builder().build_context_from_file(
+            tech_csv,
+            source_language="en",
+            provider="gemini"
+        )
 
-            # Verify context
-            assert isinstance(context, str)
-            assert len(context) > 0
+        print(f"\nGenerated Context from CSV:")
+        print(f"{context}")
 
-            print("✓ Context building from CSV successful\n")
+        # Verify context
+        assert isinstance(context, str)
+        assert len(context) > 0
 
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("API key not configured")
-            raise
+        print("✓ Context building from CSV successful\n")
 
     @pytest.mark.asyncio
     async def test_build_simple_context_functionality(self, tech_tutorial_segments):
         """Test the simple context builder (no API required)."""
         print(f"\n\nTest: Build simple context (no API)")
 
-        context = context_builder.build_simple_context(tech_tutorial_segments)
+        context = _simple_context(tech_tutorial_segments)
 
         print(f"\nSimple Context:")
         print(f"{context}")
@@ -217,68 +253,48 @@ class TestContextBuilderIntegration:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_context_comparison_simple_vs_llm(self, tech_tutorial_segments):
+    async def test_context_comparison_simple_vs_llm(self, tech_tutorial_segments, llm_contexts):
         """Compare simple context vs LLM-generated context."""
         print(f"\n\nTest: Compare simple vs LLM context")
 
         # Build simple context
-        simple_context = context_builder.build_simple_context(tech_tutorial_segments)
+        simple_context = _simple_context(tech_tutorial_segments)
         print(f"\nSimple Context ({len(simple_context)} chars):")
         print(f"{simple_context}\n")
 
-        try:
-            # Build LLM context
-            llm_context = await context_builder.build_context(
-                tech_tutorial_segments,
-                source_language="en",
-                provider="gemini"
-            )
-            print(f"LLM Context ({len(llm_context)} chars):")
-            print(f"{llm_context}\n")
-
-            # Compare
-            print("Comparison:")
-            print(f"  Simple length: {len(simple_context)} chars")
-            print(f"  LLM length: {len(llm_context)} chars")
-            print(f"  LLM is more concise: {len(llm_context) < len(simple_context)}")
-
-            print("\n✓ Context comparison successful\n")
-
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("API key not configured")
-            raise
+        # Reuse the memoized LLM context
+        llm_context = _unwrap_context(llm_contexts["tech_gemini"])
+        print(f"LLM Context ({len(llm_context)} chars):")
+        print(f"{llm_context}\n")
+
+        # Compare
+        print("Comparison:")
+        print(f"  Simple length: {len(simple_context)} chars")
+        print(f"  LLM length: {len(llm_context)} chars")
+        print(f"  LLM is more concise: {len(llm_context) < len(simple_context)}")
+
+        print("\n✓ Context comparison successful\n")
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_context_for_translation(self, tech_tutorial_segments):
+    async def test_context_for_translation(self, llm_contexts):
         """Test that context is suitable for translation purposes."""
         print(f"\n\nTest: Context quality for translation")
 
-        try:
-            context = await context_builder.build_context(
-                tech_tutorial_segments,
-                source_language="en",
-                provider="gemini"
-            )
-
-            print(f"\nContext for translation:")
-            print(f"{context}\n")
+        context = _unwrap_context(llm_contexts["tech_gemini"])
 
-            # Verify context characteristics for translation
-            assert len(context) > 10, "Context too short to be useful"
-            assert len(context) < 500, "Context too long for efficient translation"
+        print(f"\nContext for translation:")
+        print(f"{context}\n")
 
-            # Check if it's descriptive (not just metadata)
-            words = context.split()
-            assert len(words) >= 5, "Context should have meaningful content"
+        # Verify context characteristics for translation
+        assert len(context) > 10, "Context too short to be useful"
+        assert len(context) < 500, "Context too long for efficient translation"
 
-            print("✓ Context is suitable for translation\n")
+        # Check if it's descriptive (not just metadata)
+        words = context.split()
+        assert len(words) >= 5, "Context should have meaningful content"
 
-        except ValueError as e:
-            if "API key" in str(e):
-                pytest.skip("API key not configured")
-            raise
+        print("✓ Context is suitable for translation\n")
 
 
 # Run tests with:
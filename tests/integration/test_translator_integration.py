@@ -12,8 +12,6 @@ Run with: pytest tests/integration/test_translator_integration.py -v -s
 import pytest
 import asyncio
 from pathlib import Path
-import tempfile
-import shutil
 
 from backend.app.services.translator import translator
 from backend.app.services.transcriber import transcriber
@@ -22,14 +20,6 @@ from backend.app.services.transcriber import transcriber
 class TestTranslatorIntegration:
     """Integration tests for translation functionality."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        # Cleanup after test
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
 
     @pytest.fixture
     def english_segments(self):
@@ -173,31 +163,40 @@ class TestTranslatorIntegration:
 
         context = "An educational video"
 
-        for lang_code, lang_name in target_languages.items():
-            print(f"\n  Testing {lang_name} ({lang_code}):")
-
-            try:
-                # Translate first segment only for speed
-                translated = await translator.translate_segment(
+        # One independent LLM round-trip per language: fire them all
+        # concurrently instead of paying four sequential RTTs
+        results = await asyncio.gather(
+            *[
+                translator.translate_segment(
                     text=english_segments[0]["text"],
                     source_language="en",
                     target_language=lang_code,
                     context=context,
                     provider="gemini"
                 )
+                for lang_code in target_languages
+            ],
+            return_exceptions=True
+        )
+
+        for (lang_code, lang_name), result in zip(target_languages.items(), results):
+            print(f"\n  Testing {lang_name} ({lang_code}):")
 
-                print(f"    Original: {english_segments[0]['text']}")
-                print(f"    {lang_name}: {translated}")
+            if isinstance(result, ValueError):
+                if "API key" in str(result):
+                    pytest.skip(f"API key not configured")
+                print(f"    ⚠ {lang_name} translation skipped: {str(result)}")
+                continue
+            if isinstance(result, BaseException):
+                raise result
 
-                assert len(translated) > 0
-                assert translated != english_segments[0]["text"]
+            print(f"    Original: {english_segments[0]['text']}")
+            print(f"    {lang_name}: {result}")
 
-                print(f"    ✓ {lang_name} translation successful")
+            assert len(result) > 0
+            assert result != english_segments[0]["text"]
 
-            except ValueError as e:
-                if "API key" in str(e):
-                    pytest.skip(f"API key not configured")
-                print(f"    ⚠ {lang_name} translation skipped: {str(e)}")
+            print(f"    ✓ {lang_name} translation successful")
 
         print("\n✓ Multi-language translation complete\n")
 
@@ -238,12 +237,12 @@ class TestTranslatorIntegration:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_translate_from_csv(self, temp_dir, english_segments):
+    async def test_translate_from_csv(self, tmp_path, english_segments):
         """Test translating from a CSV file."""
         print(f"\n\nTest: Translate from CSV file")
 
         # Save segments to CSV
-        csv_path = temp_dir / "transcript.csv"
+        csv_path = tmp_path / "transcript.csv"
         await transcriber.save_transcript_to_csv(english_segments, csv_path)
         print(f"Transcript CSV saved: {csv_path}")
 
@@ -274,9 +273,9 @@ class TestTranslatorIntegration:
                 pytest.skip("API key not configured")
             raise
 
-    @pytest:mark.asyncio
+    @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_save_and_load_translations(self, temp_dir):
+    async def test_save_and_load_translations(self, tmp_path):
         """Test saving translations to CSV and loading them back."""
         print(f"\n\nTest: Save and load translations")
 
@@ -297,7 +296,7 @@ class TestTranslatorIntegration:
         ]
 
         # Save to CSV
-        output_csv = temp_dir / "translations.csv"
+        output_csv = tmp_path / "translations.csv"
         saved_path = await translator.save_translated_segments_to_csv(
             translated_segments,
             output_csv
@@ -306,17 +305,22 @@ class TestTranslatorIntegration:
         print(f"Translations saved to: {saved_path}")
         assert saved_path.exists()
 
-        # Read CSV to verify content
+        # Verify content through the serializer instead of re-parsing the
+        # file from disk; the save path writes exactly this string
         import csv
-        with open(saved_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-            assert len(rows) == 2
-            assert rows[0]['original_text'] == "Hello world"
-            assert rows[0]['translated_text'] == "Hola mundo"
-            assert rows[1]['original_text'] == "Good morning"
-            assert rows[1]['translated_text'] == "Buenos días"
+        import io
+        from backend.app.services.translator import Translator
+
+        content = Translator._rows_to_csv(translated_segments)
+        assert saved_path.read_bytes().decode('utf-8') == content
+
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        assert len(rows) == 2
+        assert rows[0]['original_text'] == "Hello world"
+        assert rows[0]['translated_text'] == "Hola mundo"
+        assert rows[1]['original_text'] == "Good morning"
+        assert rows[1]['translated_text'] == "Buenos días"
 
         print("✓ Save and load translations successful\n")
 
@@ -1,8 +1,6 @@
 import pytest
 import asyncio
 from pathlib import Path
-import tempfile
-import shutil
 
 from backend.app.services.context_builder import ContextBuilder, context_builder
 
@@ -10,14 +8,6 @@ from backend.app.services.context_builder import ContextBuilder, context_builder
 class TestContextBuilder:
     """Test suite for ContextBuilder service."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        # Cleanup after test
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
 
     @pytest.fixture
     def sample_segments(self):
@@ -81,20 +71,20 @@ class TestContextBuilder:
         assert len(context) > 0
 
     @pytest.mark.asyncio
-    async def test_build_context_from_file_not_found(self, temp_dir):
+    async def test_build_context_from_file_not_found(self, tmp_path):
         """Test building context from non-existent CSV file."""
-        non_existent_csv = temp_dir / "non_existent.csv"
+        non_existent_csv = tmp_path / "non_existent.csv"
 
         with pytest.raises(FileNotFoundError):
             await context_builder.build_context_from_file(non_existent_csv)
 
     @pytest.mark.asyncio
-    async def test_build_context_from_file(self, temp_dir, sample_segments):
+    async def test_build_context_from_file(self, tmp_path, sample_segments):
         """Test building context from CSV file."""
         from backend.app.services.transcriber import transcriber
 
         # Save segments to CSV
-        csv_path = temp_dir / "transcript.csv"
+        csv_path = tmp_path / "transcript.csv"
         await transcriber.save_transcript_to_csv(sample_segments, csv_path)
 
         # Build context from file
@@ -1,55 +1,51 @@
 import pytest
 import asyncio
 from pathlib import Path
-import tempfile
-import shutil
 
 from backend.app.services.srt_generator import SRTGenerator, srt_generator
 
+# Shared at module scope so parametrize tables and fixtures build the
+# sample data once instead of once per test
+_TRANSLATED_SEGMENTS = [
+    {
+        "start": 0.0,
+        "end": 2.5,
+        "text": "Hello world",
+        "translated_text": "Hola mundo"
+    },
+    {
+        "start": 2.5,
+        "end": 5.0,
+        "text": "This is a test",
+        "translated_text": "Esta es una prueba"
+    },
+    {
+        "start": 5.0,
+        "end": 7.5,
+        "text": "Testing SRT generation",
+        "translated_text": "Probando generación de SRT"
+    }
+]
+
+_PLAIN_SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": "Hello world"},
+    {"start": 2.5, "end": 5.0, "text": "This is a test"}
+]
+
 
 class TestSRTGenerator:
     """Test suite for SRTGenerator service."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        temp_path = Path(tempfile.mkdtemp())
-        yield temp_path
-        # Cleanup after test
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
 
     @pytest.fixture
     def sample_translated_segments(self):
         """Sample translated segments for testing."""
-        return [
-            {
-                "start": 0.0,
-                "end": 2.5,
-                "text": "Hello world",
-                "translated_text": "Hola mundo"
-            },
-            {
-                "start": 2.5,
-                "end": 5.0,
-                "text": "This is a test",
-                "translated_text": "Esta es una prueba"
-            },
-            {
-                "start": 5.0,
-                "end": 7.5,
-                "text": "Testing SRT generation",
-                "translated_text": "Probando generación de SRT"
-            }
-        ]
+        return _TRANSLATED_SEGMENTS
 
     @pytest.fixture
     def sample_segments(self):
         """Sample segments without translation for testing."""
-        return [
-            {"start": 0.0, "end": 2.5, "text": "Hello world"},
-            {"start": 2.5, "end": 5.0, "text": "This is a test"}
-        ]
+        return _PLAIN_SEGMENTS
 
     def test_format_timestamp(self):
         """Test timestamp formatting."""
@@ -59,6 +55,19 @@ class TestSRTGenerator:
         assert srt_generator.format_timestamp(65.123) == "00:01:05,123"
         assert srt_generator.format_timestamp(3661.5) == "01:01:01,500"
 
+    def test_format_timestamp_batch_matches_scalar(self):
+        """Test the vectorized formatter agrees with the scalar one.
+
+        1.001 is not float-exact (1000.999...), so truncation instead of
+        rounding would drop a millisecond here.
+        """
+        values = [0.0, 1.001, 2.5, 65.123, 3661.5, 59.999]
+
+        batch = SRTGenerator._format_timestamps(values)
+
+        assert batch == [srt_generator.format_timestamp(v) for v in values]
+        assert batch[1] == "00:00:01,001"
+
     def test_create_subtitle(self):
         """Test subtitle creation."""
         subtitle = srt_generator.create_subtitle(
@@ -73,55 +82,70 @@ class TestSRTGenerator:
         assert subtitle.end.total_seconds() == 2.5
         assert subtitle.content == "Hello world"
 
-    def test_generate_srt_from_segments_with_translation(self, sample_translated_segments):
-        """Test generating SRT from translated segments."""
+    @pytest.mark.parametrize("segments,use_translated,expected_substrings", [
+        pytest.param(
+            _TRANSLATED_SEGMENTS, True,
+            ("1\n", "00:00:00,000 --> 00:00:02,500", "Hola mundo",
+             "2\n", "Esta es una prueba"),
+            id="with_translation"
+        ),
+        pytest.param(
+            _PLAIN_SEGMENTS, False,
+            ("1\n", "00:00:00,000 --> 00:00:02,500", "Hello world"),
+            id="without_translation"
+        ),
+    ])
+    def test_generate_srt_from_segments(self, segments, use_translated, expected_substrings):
+        """Test generating SRT content in both text modes."""
         srt_content = srt_generator.generate_srt_from_segments(
-            sample_translated_segments,
-            use_translated=True
+            segments,
+            use_translated=use_translated
         )
 
         # Verify SRT format
-        assert "1\n" in srt_content
-        assert "00:00:00,000 --> 00:00:02,500" in srt_content
-        assert "Hola mundo" in srt_content
-        assert "2\n" in srt_content
-        assert "Esta es una prueba" in srt_content
-
-    def test_generate_srt_from_segments_without_translation(self, sample_segments):
-        """Test generating SRT from original text."""
+        for expected in expected_substrings:
+            assert expected in srt_content
+
+    @pytest.mark.parametrize("segments,match", [
+        pytest.param(
+            [], "Cannot generate SRT from empty segments", id="empty"
+        ),
+        pytest.param(
+            [{"start": 0.0, "text": "Hello"}],  # Missing 'end'
+            "missing 'start' or 'end' field", id="missing_timing"
+        ),
+        pytest.param(
+            [{"start": 0.0, "end": 2.5}],  # Missing 'text'
+            "missing 'text' field", id="missing_text"
+        ),
+    ])
+    def test_generate_srt_invalid_segments_raises_error(self, segments, match):
+        """Test generating SRT from invalid segments raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            srt_generator.generate_srt_from_segments(segments, use_translated=False)
+
+    def test_generate_srt_collapses_blank_line_runs(self):
+        """Test that runs of blank lines inside a cue don't split it."""
+        segments = [
+            {"start": 0.0, "end": 2.5, "text": "line1\n\n\n\nline2"},
+            {"start": 2.5, "end": 5.0, "text": "line3"}
+        ]
+
         srt_content = srt_generator.generate_srt_from_segments(
-            sample_segments,
-            use_translated=False
+            segments, use_translated=False
         )
 
-        # Verify SRT format
-        assert "1\n" in srt_content
-        assert "00:00:00,000 --> 00:00:02,500" in srt_content
-        assert "Hello world" in srt_content
+        # The generated document must round-trip through our own parser
+        parsed = srt_generator.parse_srt(srt_content)
 
-    def test_generate_srt_empty_segments_raises_error(self):
-        """Test generating SRT from empty segments raises error."""
-        with pytest.raises(ValueError, match="Cannot generate SRT from empty segments"):
-            srt_generator.generate_srt_from_segments([])
-
-    def test_generate_srt_missing_fields_raises_error(self):
-        """Test generating SRT with missing fields raises error."""
-        invalid_segments = [{"start": 0.0, "text": "Hello"}]  # Missing 'end'
-
-        with pytest.raises(ValueError, match="missing 'start' or 'end' field"):
-            srt_generator.generate_srt_from_segments(invalid_segments, use_translated=False)
-
-    def test_generate_srt_missing_text_field_raises_error(self):
-        """Test generating SRT with missing text field raises error."""
-        invalid_segments = [{"start": 0.0, "end": 2.5}]  # Missing 'text'
-
-        with pytest.raises(ValueError, match="missing 'text' field"):
-            srt_generator.generate_srt_from_segments(invalid_segments, use_translated=False)
+        assert len(parsed) == 2
+        assert parsed[0]['text'] == "line1\nline2"
+        assert parsed[1]['text'] == "line3"
 
     @pytest.mark.asyncio
-    async def test_save_srt(self, temp_dir, sample_translated_segments):
+    async def test_save_srt(self, tmp_path, sample_translated_segments):
         """Test saving SRT to file."""
-        output_path = temp_dir / "subtitles.srt"
+        output_path = tmp_path / "subtitles.srt"
 
         result_path = await srt_generator.save_srt(
             sample_translated_segments,
@@ -140,9 +164,9 @@ class TestSRTGenerator:
             assert "00:00:00,000 --> 00:00:02,500" in content
 
     @pytest.mark.asyncio
-    async def test_load_srt(self, temp_dir, sample_translated_segments):
+    async def test_load_srt(self, tmp_path, sample_translated_segments):
         """Test loading SRT from file."""
-        output_path = temp_dir / "subtitles.srt"
+        output_path = tmp_path / "subtitles.srt"
 
         # First save an SRT file
         await srt_generator.save_srt(sample_translated_segments, output_path, use_translated=True)
@@ -157,9 +181,9 @@ class TestSRTGenerator:
         assert loaded_segments[0]['text'] == "Hola mundo"
 
     @pytest.mark.asyncio
-    async def test_load_srt_file_not_found(self, temp_dir):
+    async def test_load_srt_file_not_found(self, tmp_path):
         """Test loading SRT from non-existent file."""
-        non_existent_srt = temp_dir / "non_existent.srt"
+        non_existent_srt = tmp_path / "non_existent.srt"
 
         with pytest.raises(FileNotFoundError):
             await srt_generator.load_srt(non_existent_srt)
@@ -186,19 +210,49 @@ Esta es una prueba
         assert segments[1]['text'] == "Esta es una prueba"
 
     @pytest.mark.asyncio
-    async def test_generate_srt_from_csv_no_output_path_or_file_id(self, temp_dir):
+    async def test_peek_srt(self, tmp_path, sample_translated_segments):
+        """Test reading SRT metadata without a full parse."""
+        output_path = tmp_path / "subtitles.srt"
+        await srt_generator.save_srt(sample_translated_segments, output_path, use_translated=True)
+
+        cue_count, first_start, last_end = srt_generator.peek_srt(output_path)
+
+        assert cue_count == 3
+        assert first_start == 0.0
+        assert last_end == 7.5
+
+    def test_peek_srt_counts_arrow_across_chunk_boundary(self, tmp_path):
+        """Test that a cue arrow straddling the 1MB scan chunks is counted."""
+        srt_path = tmp_path / "subtitles.srt"
+        first_cue = b"1\n00:00:00,000 --> 00:00:02,500\nHello"
+        second_cue = b"\n\n2\n00:00:02,500 --> 00:00:05,000\nWorld\n"
+        # Pad the first cue's text so the second cue's arrow starts one
+        # byte before the 1MB chunk boundary, split as b'-' | b'->'
+        boundary = 1 << 20
+        arrow_offset = len(first_cue) + second_cue.index(b'-->')
+        padding = b'x' * (boundary - 1 - arrow_offset)
+        srt_path.write_bytes(first_cue + padding + second_cue)
+
+        cue_count, first_start, last_end = srt_generator.peek_srt(srt_path)
+
+        assert cue_count == 2
+        assert first_start == 0.0
+        assert last_end == 5.0
+
+    @pytest.mark.asyncio
+    async def test_generate_srt_from_csv_no_output_path_or_file_id(self, tmp_path):
         """Test generating SRT from CSV fails when neither output_path nor file_id is provided."""
-        csv_path = temp_dir / "transcript.csv"
+        csv_path = tmp_path / "transcript.csv"
         csv_path.touch()
 
         with pytest.raises(ValueError, match="Either output_path or file_id must be provided"):
             await srt_generator.generate_srt_from_csv(csv_path)
 
     @pytest.mark.asyncio
-    async def test_generate_srt_from_csv_file_not_found(self, temp_dir):
+    async def test_generate_srt_from_csv_file_not_found(self, tmp_path):
         """Test generating SRT from non-existent CSV file."""
-        non_existent_csv = temp_dir / "non_existent.csv"
-        output_path = temp_dir / "output.srt"
+        non_existent_csv = tmp_path / "non_existent.csv"
+        output_path = tmp_path / "output.srt"
 
         with pytest.raises(FileNotFoundError):
             await srt_generator.generate_srt_from_csv(non_existent_csv, output_path=output_path)
@@ -0,0 +1,44 @@
+import pytest
+from pathlib import Path
+
+from backend.app.services.transcript_table import TranscriptTable
+
+
+class TestTranscriptTable:
+    """Test suite for the columnar TranscriptTable."""
+
+
+    @pytest.fixture
+    def sample_segments(self):
+        """Sample transcript segments for testing."""
+        return [
+            {"start": 0.0, "end": 2.5, "text": "Hello world"},
+            {"start": 2.5, "end": 5.0, "text": "This is a test"},
+            {"start": 5.0, "end": 7.5, "text": "Testing transcription"}
+        ]
+
+    def test_from_dicts_to_dicts_round_trip(self, sample_segments):
+        """Test converting segments to a table and back."""
+        table = TranscriptTable.from_dicts(sample_segments)
+
+        assert len(table) == 3
+        assert table.to_dicts() == sample_segments
+
+    def test_csv_round_trip(self, tmp_path, sample_segments):
+        """Test saving a table to CSV and loading it back."""
+        csv_path = tmp_path / "transcript.csv"
+
+        table = TranscriptTable.from_dicts(sample_segments)
+        table.to_csv(csv_path)
+
+        loaded = TranscriptTable.from_csv(csv_path)
+        assert loaded.to_dicts() == sample_segments
+
+    def test_full_text(self, sample_segments):
+        """Test concatenating all segment texts."""
+        table = TranscriptTable.from_dicts(sample_segments)
+
+        assert table.full_text() == "Hello world This is a test Testing transcription"
+
+
+# Run tests with: pytest tests/unit/test_transcript_table.py -v